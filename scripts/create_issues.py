@@ -14,17 +14,33 @@ Environment Variables:
 """
 
 import argparse
+import hashlib
 import json
 import logging
 import os
+import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import quote
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("Error: requests library not found. Install with: pip install requests", file=sys.stderr)
     sys.exit(1)
@@ -36,29 +52,258 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of tasks processed concurrently against the GitHub API
+MAX_CONCURRENT_TASKS = 4
+
+# Keep-alive connections pooled for api.github.com (at least one per worker)
+CONNECTION_POOL_SIZE = 10
+
+# Rate-limit handling
+RATE_LIMIT_THRESHOLD = 5  # Pause when fewer requests than this remain
+MAX_RETRIES = 3
+RETRY_BACKOFF = 2  # seconds, doubled on each retry
+
+# Maximum createIssue mutations sent in one GraphQL request
+GRAPHQL_BATCH_SIZE = 20
+
+# Label applied to every automation-created issue, used to list them in bulk
+TASK_LABEL = 'automation/codex'
+
+# On-disk cache of issue listings, revalidated with ETags between runs
+ISSUE_CACHE_FILE = Path(
+    os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
+) / 'pr-cybr' / 'issues_cache.json'
+
+# Issue body shared by created and updated issues
+_ISSUE_BODY_TMPL = (
+    "{description}\n"
+    "\n"
+    "---\n"
+    "**Task ID:** `{task_id}`\n"
+    "**Priority:** {priority}\n"
+    "**Type:** {type}\n"
+    "**Explicit:** {explicit_str}"
+)
+
+# Repository node ID and label IDs needed by the createIssue mutation
+_REPOSITORY_IDS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100, after: $cursor) {
+      nodes { id name }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# Matches the "[TASK_ID]" prefix of issue titles created by this script
+_TASK_ID_RE = re.compile(r'^\[([^\]]+)\]')
+
+# Content hash embedded in issue bodies, used to skip no-op updates
+_CONTENT_HASH_MARKER = "<!-- pr-cybr-hash:{} -->"
+_CONTENT_HASH_RE = re.compile(r'<!-- pr-cybr-hash:([0-9a-f]+) -->')
+
+
+class _RateLimiter:
+    """Tracks GitHub rate-limit headers and pauses only when quota runs low."""
+    
+    def __init__(self, threshold: int = RATE_LIMIT_THRESHOLD):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            threshold: Remaining-request count below which calls wait for reset
+        """
+        self.threshold = threshold
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def update(self, headers: Dict[str, str]) -> None:
+        """
+        Record quota state from a GitHub API response.
+        
+        Args:
+            headers: Response headers
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset_at = headers.get('X-RateLimit-Reset')
+        
+        with self._lock:
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset_at is not None:
+                self.reset_at = float(reset_at)
+    
+    def wait(self) -> None:
+        """Sleep until the quota resets if too few requests remain."""
+        with self._lock:
+            if self.remaining is None or self.reset_at is None:
+                return
+            if self.remaining >= self.threshold:
+                return
+            delay = self.reset_at - time.time()
+        
+        if delay > 0:
+            logger.warning(f"Rate limit nearly exhausted, sleeping {delay:.0f}s until reset")
+            time.sleep(delay)
+
+
+def get_meeting_id(task: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the meeting ID from a task's meeting/<id> label.
+    
+    Args:
+        task: Task dictionary
+        
+    Returns:
+        Meeting ID, or None if the task has no meeting label
+    """
+    return next(
+        (label.split('/')[-1] for label in task.get('labels', ()) if label.startswith('meeting/')),
+        None
+    )
+
+
+def format_issue_body(
+    task: Dict[str, Any],
+    meeting_id: Optional[str] = None,
+    updated_at: Optional[str] = None,
+    content_hash: Optional[str] = None
+) -> str:
+    """
+    Format the issue body for a task.
+    
+    Args:
+        task: Task dictionary
+        meeting_id: Optional meeting reference to include
+        updated_at: Optional "last updated" timestamp footer
+        content_hash: Optional hash to embed as a hidden HTML comment
+        
+    Returns:
+        Issue body in Markdown
+    """
+    body = _ISSUE_BODY_TMPL.format_map({
+        **task,
+        'explicit_str': 'Yes' if task.get('explicit', False) else 'No (Inferred)'
+    })
+    
+    if meeting_id:
+        body += f"\n**Meeting:** {meeting_id}"
+    
+    if updated_at:
+        body += f"\n\n*Last updated: {updated_at}*"
+    
+    if content_hash:
+        body += "\n\n" + _CONTENT_HASH_MARKER.format(content_hash)
+    
+    return body
+
+
+def issue_content_hash(task: Dict[str, Any], meeting_id: Optional[str] = None) -> str:
+    """
+    Compute a stable hash of the issue content managed for a task.
+    
+    Covers the rendered body (without the timestamp footer) and the labels,
+    so an unchanged task produces the same hash on every run.
+    
+    Args:
+        task: Task dictionary
+        meeting_id: Optional meeting reference included in the body
+        
+    Returns:
+        16-character hex digest
+    """
+    content = format_issue_body(task, meeting_id) + "\n" + ",".join(sorted(task.get('labels', [])))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+
 
 class GitHubIssueCreator:
     """Handles creation and updating of GitHub issues."""
     
-    def __init__(self, token: str, organization: str, agent_mapping: Dict[str, str]):
+    def __init__(
+        self,
+        token: str,
+        config: Dict[str, Any],
+        cache_path: Optional[Path] = ISSUE_CACHE_FILE
+    ):
         """
         Initialize the GitHub issue creator.
         
         Args:
             token: GitHub personal access token
-            organization: GitHub organization name
-            agent_mapping: Dictionary mapping agent IDs to repository names
+            config: Parsed agents config (see load_config), providing the
+                'organization' name and the 'agents' to repository mapping
+            cache_path: Issue listing cache file, or None to disable caching
         """
         self.token = token
-        self.organization = organization
-        self.agent_mapping = agent_mapping
+        self.config = config
+        self.organization = config.get('organization', 'PR-CYBR')
+        self.agent_mapping = config.get('agents', {})
         self.base_url = "https://api.github.com"
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE
+        )
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'PR-CYBR-P0D-IssueCreator/1.0'
         })
+        self.rate_limiter = _RateLimiter()
+        self._issue_index: Dict[str, Optional[Dict[str, int]]] = {}
+        self._issue_hashes: Dict[str, Dict[str, str]] = {}
+        self._index_lock = threading.Lock()
+        self._prefetch_locks: Dict[str, threading.Lock] = {}
+        self._repository_ids: Dict[str, Optional[Tuple[str, Dict[str, str]]]] = {}
+        self.cache_path = cache_path
+        self._issue_cache = self._load_issue_cache()
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send an API request, honoring GitHub rate-limit headers.
+        
+        Waits for the quota to reset when it is nearly exhausted, and retries
+        with exponential backoff when GitHub answers 403/429 with Retry-After
+        or an exhausted quota.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Additional arguments passed to requests
+            
+        Returns:
+            Response object (not yet checked for HTTP errors)
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            self.rate_limiter.wait()
+            response = self.session.request(method, url, **kwargs)
+            self.rate_limiter.update(response.headers)
+            
+            if response.status_code not in (403, 429) or attempt == MAX_RETRIES:
+                return response
+            
+            retry_after = response.headers.get('Retry-After')
+            if retry_after is not None:
+                delay = max(float(retry_after), RETRY_BACKOFF * 2 ** attempt)
+            elif response.headers.get('X-RateLimit-Remaining') == '0':
+                reset_at = float(response.headers.get('X-RateLimit-Reset', time.time()))
+                delay = max(reset_at - time.time(), RETRY_BACKOFF * 2 ** attempt)
+            else:
+                # Plain permission error, retrying will not help
+                return response
+            
+            logger.warning(
+                f"Rate limited by GitHub ({response.status_code}), "
+                f"retrying in {delay:.0f}s (attempt {attempt + 1}/{MAX_RETRIES})"
+            )
+            time.sleep(delay)
+        
+        return response
     
     def get_repository_name(self, agent_id: str, fallback_repo: Optional[str] = None) -> str:
         """
@@ -79,6 +324,147 @@ class GitHubIssueCreator:
             raise ValueError(f"Unknown agent ID: {agent_id}")
         return repo
     
+    def _load_issue_cache(self) -> Dict[str, Any]:
+        """
+        Load cached issue listings from disk.
+        
+        Returns:
+            Dictionary mapping "org/repo" to {'pages': [...]}, one
+            {'url', 'etag', 'next', 'issues', 'hashes'} entry per listing page
+        """
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable issue cache {self.cache_path}: {e}")
+            return {}
+    
+    def save_issue_cache(self) -> None:
+        """Persist issue listing pages and their ETags for the next run."""
+        if not self.cache_path:
+            return
+        
+        # Pages are stored exactly as GitHub served them; issues created or
+        # updated during this run change those pages' ETags, so the next run
+        # refetches them instead of trusting a locally patched copy
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._issue_cache, f, indent=2)
+            logger.debug("Saved issue cache to %s", self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save issue cache: {e}")
+    
+    def prefetch_issues(self, repo: str) -> Optional[Dict[str, int]]:
+        """
+        List all automation issues in a repository and index them by task_id.
+        
+        One paginated listing replaces a Search API call per task. The index
+        is cached per repository for the lifetime of the creator, and each
+        listing page is cached on disk between runs with its ETag: every page
+        is requested with If-None-Match, a 304 (which does not count against
+        the rate limit) reuses that page, and any other page is parsed fresh.
+        
+        Args:
+            repo: Repository name
+            
+        Returns:
+            Dictionary mapping task IDs to issue numbers, or None if the
+            listing failed
+        """
+        with self._index_lock:
+            if repo in self._issue_index:
+                return self._issue_index[repo]
+            repo_lock = self._prefetch_locks.setdefault(repo, threading.Lock())
+        
+        # The per-repository lock makes each repository listed once, while
+        # other repositories and issue index updates carry on meanwhile
+        with repo_lock:
+            with self._index_lock:
+                if repo in self._issue_index:
+                    return self._issue_index[repo]
+            
+            logger.info(f"Prefetching issues from {self.organization}/{repo}")
+            
+            cache_key = f"{self.organization}/{repo}"
+            cached_pages = {
+                page['url']: page
+                for page in self._issue_cache.get(cache_key, {}).get('pages', [])
+            }
+            
+            index: Optional[Dict[str, int]] = {}
+            hashes: Dict[str, str] = {}
+            pages: List[Dict[str, Any]] = []
+            reused = 0
+            url = f"{self.base_url}/repos/{self.organization}/{repo}/issues"
+            params = {
+                'labels': TASK_LABEL,
+                'state': 'all',
+                'per_page': 100
+            }
+            
+            try:
+                while url:
+                    cached = cached_pages.get(url)
+                    headers = {'If-None-Match': cached['etag']} if cached else {}
+                    response = self._request('GET', url, params=params, headers=headers)
+                    response.raise_for_status()
+                    
+                    if response.status_code == 304:
+                        page = cached
+                        reused += 1
+                    else:
+                        page = {
+                            'url': url,
+                            'etag': response.headers.get('ETag'),
+                            # Subsequent pages carry their query string in the link
+                            'next': response.links.get('next', {}).get('url'),
+                            'issues': {},
+                            'hashes': {}
+                        }
+                        for item in response.json():
+                            if 'pull_request' in item:
+                                continue
+                            match = _TASK_ID_RE.match(item.get('title', ''))
+                            if match and match.group(1) not in page['issues']:
+                                page['issues'][match.group(1)] = item['number']
+                                hash_match = _CONTENT_HASH_RE.search(item.get('body') or '')
+                                if hash_match:
+                                    page['hashes'][match.group(1)] = hash_match.group(1)
+                    
+                    # Earlier pages win, matching a single pass over the listing
+                    for task_id, number in page['issues'].items():
+                        if task_id not in index:
+                            index[task_id] = number
+                            if task_id in page['hashes']:
+                                hashes[task_id] = page['hashes'][task_id]
+                    
+                    pages.append(page)
+                    url = page['next']
+                    params = None
+                
+                logger.info(
+                    f"Indexed {len(index)} existing issues in {repo} "
+                    f"({reused}/{len(pages)} pages unchanged)"
+                )
+                    
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Error listing issues for {repo}: {e}")
+                index = None
+            
+            with self._index_lock:
+                self._issue_index[repo] = index
+                if index is not None:
+                    self._issue_hashes[repo] = hashes
+                    if all(page['etag'] for page in pages):
+                        self._issue_cache[cache_key] = {'pages': pages}
+                    else:
+                        self._issue_cache.pop(cache_key, None)
+            return index
+    
     def search_issue_by_task_id(self, repo: str, task_id: str) -> Optional[int]:
         """
         Search for an existing issue by task_id label.
@@ -90,7 +476,7 @@ class GitHubIssueCreator:
         Returns:
             Issue number if found, None otherwise
         """
-        logger.debug(f"Searching for existing issue with task_id: {task_id}")
+        logger.debug("Searching for existing issue with task_id: %s", task_id)
         
         # Search for issues with the task_id in the title or labels
         query = f"repo:{self.organization}/{repo} {task_id} in:title"
@@ -102,7 +488,7 @@ class GitHubIssueCreator:
         }
         
         try:
-            response = self.session.get(url, params=params)
+            response = self._request('GET', url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -110,7 +496,7 @@ class GitHubIssueCreator:
             
             if items:
                 issue_number = items[0]['number']
-                logger.info(f"Found existing issue #{issue_number} for task {task_id}")
+                logger.info("Found existing issue #%s for task %s", issue_number, task_id)
                 return issue_number
             
             return None
@@ -119,13 +505,241 @@ class GitHubIssueCreator:
             logger.warning(f"Error searching for issue: {e}")
             return None
     
-    def create_issue(self, repo: str, task: Dict[str, Any]) -> int:
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GraphQL query or mutation.
+        
+        Args:
+            query: GraphQL document
+            variables: Query variables
+            
+        Returns:
+            Response payload with 'data' and, on partial failure, 'errors'
+            
+        Raises:
+            requests.exceptions.RequestException: If API request fails
+        """
+        response = self._request(
+            'POST',
+            f"{self.base_url}/graphql",
+            json={'query': query, 'variables': variables}
+        )
+        response.raise_for_status()
+        
+        result = response.json()
+        for error in result.get('errors', []):
+            logger.warning(f"GraphQL error: {error.get('message')}")
+        return result
+    
+    def get_repository_ids(self, repo: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Get the GraphQL node IDs of a repository and its labels.
+        
+        Args:
+            repo: Repository name
+            
+        Returns:
+            Tuple of (repository ID, label name to label ID mapping), or None
+            if the lookup failed
+        """
+        with self._index_lock:
+            if repo in self._repository_ids:
+                return self._repository_ids[repo]
+        
+        repository_id = None
+        label_ids: Dict[str, str] = {}
+        variables = {'owner': self.organization, 'name': repo, 'cursor': None}
+        
+        try:
+            while True:
+                result = self._graphql(_REPOSITORY_IDS_QUERY, variables)
+                repository = (result.get('data') or {}).get('repository')
+                if not repository:
+                    break
+                
+                repository_id = repository['id']
+                labels = repository['labels']
+                for node in labels['nodes']:
+                    label_ids[node['name']] = node['id']
+                
+                if not labels['pageInfo']['hasNextPage']:
+                    break
+                variables['cursor'] = labels['pageInfo']['endCursor']
+                
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Error looking up GraphQL IDs for {repo}: {e}")
+        
+        ids = (repository_id, label_ids) if repository_id else None
+        with self._index_lock:
+            self._repository_ids[repo] = ids
+        return ids
+    
+    def ensure_labels(self, repo: str, names: List[str]) -> None:
+        """
+        Create labels missing from a repository and record their node IDs.
+        
+        createIssue takes label IDs and, unlike the REST endpoint, does not
+        create missing labels, so new ones (such as a new meeting's
+        meeting/<id> label) are created up front.
+        
+        Args:
+            repo: Repository name
+            names: Label names the issues will use
+        """
+        ids = self.get_repository_ids(repo)
+        if not ids:
+            return
+        label_ids = ids[1]
+        url = f"{self.base_url}/repos/{self.organization}/{repo}/labels"
+        
+        for name in dict.fromkeys(names):
+            if name in label_ids:
+                continue
+            
+            logger.info(f"Creating label '{name}' in {self.organization}/{repo}")
+            try:
+                response = self._request('POST', url, json={'name': name})
+                if response.status_code == 422:
+                    # Already exists (e.g. created since the IDs were fetched)
+                    response = self._request('GET', f"{url}/{quote(name, safe='')}")
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Could not create label '{name}' in {repo}: {e}")
+                continue
+            
+            with self._index_lock:
+                label_ids[name] = response.json()['node_id']
+    
+    def create_issues_batch(self, repo: str, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create issues for several tasks with batched GraphQL mutations.
+        
+        Up to GRAPHQL_BATCH_SIZE aliased createIssue mutations are sent per
+        request. Labels missing from the repository are created first (the
+        mutation takes label IDs). Tasks whose labels still could not be
+        resolved, and tasks whose mutation failed, fall back to create_issue.
+        
+        Args:
+            repo: Repository name
+            tasks: Task dictionaries to create issues for
+            
+        Returns:
+            Result dictionaries in the same order as tasks
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        rest_tasks: List[Dict[str, Any]] = []
+        batchable: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        
+        self.ensure_labels(repo, [label for task in tasks for label in task.get('labels', [])])
+        ids = self.get_repository_ids(repo)
+        for task in tasks:
+            task_id = task.get('task_id', 'unknown')
+            try:
+                issue_input = {
+                    'repositoryId': ids[0] if ids else None,
+                    'title': f"[{task['task_id']}] {task['title']}",
+                    'body': format_issue_body(
+                        task,
+                        get_meeting_id(task),
+                        content_hash=issue_content_hash(task, get_meeting_id(task))
+                    ),
+                    'labelIds': [ids[1].get(label) for label in task.get('labels', [])] if ids else [None]
+                }
+            except KeyError as e:
+                logger.error(f"Error processing task {task_id}: missing field {e}")
+                results[task_id] = {
+                    'task_id': task_id,
+                    'status': 'error',
+                    'error': f"missing field {e}"
+                }
+                continue
+            
+            if None in issue_input['labelIds']:
+                rest_tasks.append(task)
+            else:
+                batchable.append((task, issue_input))
+        
+        for start in range(0, len(batchable), GRAPHQL_BATCH_SIZE):
+            chunk = batchable[start:start + GRAPHQL_BATCH_SIZE]
+            variables = {f"i{n}": issue_input for n, (_, issue_input) in enumerate(chunk)}
+            declarations = ", ".join(f"$i{n}: CreateIssueInput!" for n in range(len(chunk)))
+            mutations = " ".join(
+                f"t{n}: createIssue(input: $i{n}) {{ issue {{ number }} }}" for n in range(len(chunk))
+            )
+            
+            logger.info(f"Creating {len(chunk)} issues in {self.organization}/{repo} via GraphQL")
+            
+            try:
+                result = self._graphql(f"mutation({declarations}) {{ {mutations} }}", variables)
+                data = result.get('data') or {}
+            except requests.exceptions.RequestException as e:
+                # The mutations may have been applied; retrying could duplicate issues
+                logger.error(f"Error creating issue batch in {repo}: {e}")
+                for task, _ in chunk:
+                    results[task['task_id']] = {
+                        'task_id': task['task_id'],
+                        'status': 'error',
+                        'error': str(e)
+                    }
+                continue
+            
+            for n, (task, _) in enumerate(chunk):
+                issue = (data.get(f"t{n}") or {}).get('issue')
+                if not issue:
+                    rest_tasks.append(task)
+                    continue
+                
+                logger.info("✅ Created issue #%s: [%s]", issue['number'], task['task_id'])
+                results[task['task_id']] = {
+                    'task_id': task['task_id'],
+                    'status': 'created',
+                    'issue_number': issue['number'],
+                    'repo': repo
+                }
+        
+        for task in rest_tasks:
+            task_id = task['task_id']
+            try:
+                issue_number = self.create_issue(repo, task)
+                results[task_id] = {
+                    'task_id': task_id,
+                    'status': 'created',
+                    'issue_number': issue_number,
+                    'repo': repo
+                }
+            except Exception as e:
+                logger.error(f"Error processing task {task_id}: {e}")
+                results[task_id] = {
+                    'task_id': task_id,
+                    'status': 'error',
+                    'error': str(e)
+                }
+        
+        issue_index = self._issue_index.get(repo)
+        with self._index_lock:
+            hashes = self._issue_hashes.setdefault(repo, {})
+            for task in tasks:
+                result = results[task.get('task_id', 'unknown')]
+                if result['status'] == 'created':
+                    hashes[result['task_id']] = issue_content_hash(task, get_meeting_id(task))
+                    if issue_index is not None:
+                        issue_index[result['task_id']] = result['issue_number']
+        
+        return [results[task.get('task_id', 'unknown')] for task in tasks]
+    
+    def create_issue(
+        self,
+        repo: str,
+        task: Dict[str, Any],
+        meeting_id: Optional[str] = None
+    ) -> int:
         """
         Create a new GitHub issue.
         
         Args:
             repo: Repository name
             task: Task dictionary containing issue details
+            meeting_id: Meeting ID (parsed from the task labels if omitted)
             
         Returns:
             Issue number of created issue
@@ -139,23 +753,13 @@ class GitHubIssueCreator:
         title = f"[{task['task_id']}] {task['title']}"
         
         # Format issue body
-        body_parts = [
-            task['description'],
-            "",
-            "---",
-            f"**Task ID:** `{task['task_id']}`",
-            f"**Priority:** {task['priority']}",
-            f"**Type:** {task['type']}",
-            f"**Explicit:** {'Yes' if task.get('explicit', False) else 'No (Inferred)'}",
-        ]
-        
-        # Add meeting reference if available
-        meeting_labels = [label for label in task.get('labels', []) if label.startswith('meeting/')]
-        if meeting_labels:
-            meeting_id = meeting_labels[0].split('/')[-1]
-            body_parts.append(f"**Meeting:** {meeting_id}")
-        
-        body = "\n".join(body_parts)
+        if meeting_id is None:
+            meeting_id = get_meeting_id(task)
+        body = format_issue_body(
+            task,
+            meeting_id,
+            content_hash=issue_content_hash(task, meeting_id)
+        )
         
         # Prepare payload
         payload = {
@@ -164,18 +768,24 @@ class GitHubIssueCreator:
             'labels': task.get('labels', [])
         }
         
-        logger.info(f"Creating issue in {self.organization}/{repo}: {title}")
+        logger.info("Creating issue in %s/%s: %s", self.organization, repo, title)
         
-        response = self.session.post(url, json=payload)
+        response = self._request('POST', url, json=payload)
         response.raise_for_status()
         
         issue_data = response.json()
         issue_number = issue_data['number']
         
-        logger.info(f"✅ Created issue #{issue_number}: {title}")
+        logger.info("✅ Created issue #%s: %s", issue_number, title)
         return issue_number
     
-    def update_issue(self, repo: str, issue_number: int, task: Dict[str, Any]) -> None:
+    def update_issue(
+        self,
+        repo: str,
+        issue_number: int,
+        task: Dict[str, Any],
+        meeting_id: Optional[str] = None
+    ) -> None:
         """
         Update an existing GitHub issue.
         
@@ -183,6 +793,7 @@ class GitHubIssueCreator:
             repo: Repository name
             issue_number: Issue number to update
             task: Task dictionary containing updated details
+            meeting_id: Meeting ID (parsed from the task labels if omitted)
             
         Raises:
             requests.exceptions.RequestException: If API request fails
@@ -190,19 +801,15 @@ class GitHubIssueCreator:
         url = f"{self.base_url}/repos/{self.organization}/{repo}/issues/{issue_number}"
         
         # Format issue body
-        body_parts = [
-            task['description'],
-            "",
-            "---",
-            f"**Task ID:** `{task['task_id']}`",
-            f"**Priority:** {task['priority']}",
-            f"**Type:** {task['type']}",
-            f"**Explicit:** {'Yes' if task.get('explicit', False) else 'No (Inferred)'}",
-            "",
-            f"*Last updated: {time.strftime('%Y-%m-%d %H:%M:%S UTC')}*"
-        ]
-        
-        body = "\n".join(body_parts)
+        if meeting_id is None:
+            meeting_id = get_meeting_id(task)
+        content_hash = issue_content_hash(task, meeting_id)
+        body = format_issue_body(
+            task,
+            meeting_id,
+            updated_at=time.strftime('%Y-%m-%d %H:%M:%S UTC'),
+            content_hash=content_hash
+        )
         
         # Prepare payload
         payload = {
@@ -210,19 +817,24 @@ class GitHubIssueCreator:
             'labels': task.get('labels', [])
         }
         
-        logger.info(f"Updating issue #{issue_number} in {self.organization}/{repo}")
+        logger.info("Updating issue #%s in %s/%s", issue_number, self.organization, repo)
         
-        response = self.session.patch(url, json=payload)
+        response = self._request('PATCH', url, json=payload)
         response.raise_for_status()
         
-        logger.info(f"✅ Updated issue #{issue_number}")
+        with self._index_lock:
+            self._issue_hashes.setdefault(repo, {})[task['task_id']] = content_hash
+        
+        logger.info("✅ Updated issue #%s", issue_number)
     
-    def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    def process_task(self, task: Dict[str, Any], defer_create: bool = False) -> Dict[str, Any]:
         """
         Process a single task by creating or updating an issue.
         
         Args:
             task: Task dictionary
+            defer_create: If True, do not create missing issues; return a
+                'pending' result for create_issues_batch instead
             
         Returns:
             Result dictionary with status and details
@@ -233,22 +845,50 @@ class GitHubIssueCreator:
         try:
             # Get repository name
             repo = self.get_repository_name(agent_id, task.get('repo'))
+            meeting_id = get_meeting_id(task)
             
-            # Check if issue already exists
-            existing_issue = self.search_issue_by_task_id(repo, task_id)
+            # Check if issue already exists. Labelled tasks are covered by the
+            # prefetched listing; anything else falls back to search on a miss.
+            issue_index = self.prefetch_issues(repo)
+            existing_issue = issue_index.get(task_id) if issue_index is not None else None
+            if existing_issue is None and (
+                issue_index is None or TASK_LABEL not in task.get('labels', [])
+            ):
+                existing_issue = self.search_issue_by_task_id(repo, task_id)
             
             if existing_issue:
+                # Skip the update when the issue already carries this content
+                existing_hash = self._issue_hashes.get(repo, {}).get(task_id)
+                if existing_hash and existing_hash == issue_content_hash(task, meeting_id):
+                    logger.info("Issue #%s for task %s is unchanged", existing_issue, task_id)
+                    return {
+                        'task_id': task_id,
+                        'status': 'unchanged',
+                        'issue_number': existing_issue,
+                        'repo': repo
+                    }
+                
                 # Update existing issue
-                self.update_issue(repo, existing_issue, task)
+                self.update_issue(repo, existing_issue, task, meeting_id=meeting_id)
                 return {
                     'task_id': task_id,
                     'status': 'updated',
                     'issue_number': existing_issue,
                     'repo': repo
                 }
+            elif defer_create:
+                return {
+                    'task_id': task_id,
+                    'status': 'pending',
+                    'repo': repo
+                }
             else:
                 # Create new issue
-                issue_number = self.create_issue(repo, task)
+                issue_number = self.create_issue(repo, task, meeting_id=meeting_id)
+                with self._index_lock:
+                    self._issue_hashes.setdefault(repo, {})[task_id] = issue_content_hash(task, meeting_id)
+                    if issue_index is not None:
+                        issue_index[task_id] = issue_number
                 return {
                     'task_id': task_id,
                     'status': 'created',
@@ -264,29 +904,78 @@ class GitHubIssueCreator:
                 'error': str(e)
             }
 
+    
+    def process_tasks(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process all tasks, batching issue creation per repository.
+        
+        Existing issues are looked up and updated concurrently over REST;
+        missing ones are then created with batched GraphQL mutations.
+        
+        Args:
+            tasks: Task dictionaries
+            
+        Returns:
+            Result dictionaries in the same order as tasks
+        """
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TASKS) as executor:
+            results = list(executor.map(lambda t: self.process_task(t, defer_create=True), tasks))
+            
+            # Group pending creates by repository (duplicate task IDs are
+            # created once, then updated like any other existing issue)
+            pending: Dict[str, Dict[str, int]] = {}
+            duplicates: List[int] = []
+            for position, result in enumerate(results):
+                if result['status'] != 'pending':
+                    continue
+                by_task_id = pending.setdefault(result['repo'], {})
+                if result['task_id'] in by_task_id:
+                    duplicates.append(position)
+                else:
+                    by_task_id[result['task_id']] = position
+            
+            batches = {
+                executor.submit(
+                    self.create_issues_batch, repo, [tasks[i] for i in positions.values()]
+                ): list(positions.values())
+                for repo, positions in pending.items()
+            }
+            for future, positions in batches.items():
+                for position, result in zip(positions, future.result()):
+                    results[position] = result
+        
+        for position in duplicates:
+            results[position] = self.process_task(tasks[position])
+        
+        return results
 
-def load_agent_mapping(config_path: Path) -> Dict[str, str]:
+
+def load_config(config_path: Path) -> Dict[str, Any]:
     """
-    Load agent to repository mapping from YAML config.
+    Load the agents YAML config.
+    
+    Uses the libyaml C loader when available.
     
     Args:
         config_path: Path to agents.yaml config file
         
     Returns:
-        Dictionary mapping agent IDs to repository names
+        Parsed config dictionary, with 'agents' mapping agent IDs to repository
+        names and 'organization' defaulting to PR-CYBR
     """
-    logger.info(f"Loading agent mapping from {config_path}")
+    logger.info(f"Loading agent config from {config_path}")
     
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
     
     with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader) or {}
     
-    agents = config.get('agents', {})
-    logger.info(f"Loaded mapping for {len(agents)} agents")
+    config.setdefault('agents', {})
+    config.setdefault('organization', 'PR-CYBR')
+    logger.info(f"Loaded mapping for {len(config['agents'])} agents")
     
-    return agents
+    return config
 
 
 def load_tasks(tasks_path: Path) -> Dict[str, Any]:
@@ -304,8 +993,11 @@ def load_tasks(tasks_path: Path) -> Dict[str, Any]:
     if not tasks_path.exists():
         raise FileNotFoundError(f"Tasks file not found: {tasks_path}")
     
-    with open(tasks_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(tasks_path.read_bytes())
+    else:
+        with open(tasks_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
     
     tasks = data.get('tasks', [])
     logger.info(f"Loaded {len(tasks)} tasks")
@@ -335,6 +1027,11 @@ def main():
         action='store_true',
         help='Simulate issue creation without making changes'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Do not read or write the issue listing cache ({ISSUE_CACHE_FILE})'
+    )
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -357,8 +1054,10 @@ def main():
         logger.info("🔍 DRY RUN MODE - No issues will be created or updated")
     
     try:
-        # Load agent mapping
-        agent_mapping = load_agent_mapping(args.config)
+        # Load agent mapping and organization
+        config = load_config(args.config)
+        agent_mapping = config['agents']
+        organization = config['organization']
         
         # Load tasks
         tasks_data = load_tasks(args.input)
@@ -370,11 +1069,6 @@ def main():
             print("⚠️  No tasks to process")
             return 0
         
-        # Get organization from config or use default
-        with open(args.config, 'r') as f:
-            config = yaml.safe_load(f)
-        organization = config.get('organization', 'PR-CYBR')
-        
         if args.dry_run:
             # In dry run mode, just log what would be done
             print(f"\n📋 Would process {len(tasks)} tasks for meeting {meeting_id}:")
@@ -385,25 +1079,27 @@ def main():
             return 0
         
         # Create issue creator
-        creator = GitHubIssueCreator(github_token, organization, agent_mapping)
+        creator = GitHubIssueCreator(
+            github_token,
+            config,
+            cache_path=None if args.no_cache else ISSUE_CACHE_FILE
+        )
         
-        # Process all tasks
-        results = []
-        for task in tasks:
-            result = creator.process_task(task)
-            results.append(result)
-            
-            # Be nice to GitHub API (rate limiting)
-            time.sleep(0.5)
+        # Process tasks concurrently, batching creates per repository
+        results = creator.process_tasks(tasks)
+        
+        creator.save_issue_cache()
         
         # Print summary
         created = sum(1 for r in results if r.get('status') == 'created')
         updated = sum(1 for r in results if r.get('status') == 'updated')
+        unchanged = sum(1 for r in results if r.get('status') == 'unchanged')
         errors = sum(1 for r in results if r.get('status') == 'error')
         
         print(f"\n✅ Processed {len(results)} tasks:")
         print(f"   📝 Created: {created}")
         print(f"   🔄 Updated: {updated}")
+        print(f"   ⏭️  Unchanged: {unchanged}")
         if errors > 0:
             print(f"   ❌ Errors: {errors}")
         
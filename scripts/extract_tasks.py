@@ -7,6 +7,7 @@ It outputs a structured JSON file containing tasks that need to be routed to age
 
 Usage:
     python extract_tasks.py --input <input_json> --output <output_json>
+    python extract_tasks.py --input-dir <transcripts_dir> --output <output_dir>
 
 Environment Variables:
     OPENAI_API_KEY: API key for OpenAI (required for LLM processing)
@@ -16,10 +17,22 @@ import argparse
 import json
 import logging
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to the compiled regex
 
 # Configure logging
 logging.basicConfig(
@@ -28,6 +41,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Common action indicators used by the stub extractor
+ACTION_KEYWORDS = (
+    'TODO', 'ACTION ITEM', 'TASK', 'NEED TO', 'SHOULD',
+    'UPDATE', 'FIX', 'IMPLEMENT', 'CREATE', 'ADD'
+)
+
+# Single pass over the upper-cased transcript for any action keyword
+_ACTION_RE = re.compile('|'.join(re.escape(kw) for kw in ACTION_KEYWORDS))
+
+
+def _build_action_automaton():
+    """Build an Aho-Corasick automaton over the action keywords, if available."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in ACTION_KEYWORDS:
+        automaton.add_word(keyword, len(keyword))
+    automaton.make_automaton()
+    return automaton
+
+
+_ACTION_AUTOMATON = _build_action_automaton()
+
 
 def load_transcript(input_path: Path) -> Dict[str, Any]:
     """
@@ -48,8 +85,11 @@ def load_transcript(input_path: Path) -> Dict[str, Any]:
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
     
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(input_path.read_bytes())
+    else:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
     
     logger.info(f"Successfully loaded transcript with {len(data.get('transcript', ''))} characters")
     return data
@@ -83,6 +123,57 @@ def extract_tasks_with_llm(transcript_data: Dict[str, Any]) -> List[Dict[str, An
     return extract_tasks_stub(transcript_data)
 
 
+def _iter_keyword_spans(upper_text: str) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (start, end) offsets of action keywords in text order.
+    
+    Uses a single Aho-Corasick pass when pyahocorasick is installed, and the
+    compiled regex otherwise.
+    
+    Args:
+        upper_text: Upper-cased transcript text
+    """
+    if _ACTION_AUTOMATON is not None:
+        for end_index, length in _ACTION_AUTOMATON.iter(upper_text):
+            yield end_index - length + 1, end_index + 1
+    else:
+        for match in _ACTION_RE.finditer(upper_text):
+            yield match.span()
+
+
+def iter_action_lines(text: str) -> Iterator[str]:
+    """
+    Yield each line of text that contains an action keyword (case-insensitive).
+    
+    Args:
+        text: Transcript text
+    """
+    upper_text = text.upper()
+    
+    if len(upper_text) != len(text):
+        # Upper-casing changed character widths (e.g. ligatures), so offsets
+        # no longer map back to the original text; scan line by line instead
+        for line in text.split('\n'):
+            if _ACTION_RE.search(line.upper()):
+                yield line
+        return
+    
+    next_line_start = 0
+    
+    for start, end in _iter_keyword_spans(upper_text):
+        # Skip further matches on a line that was already taken
+        if start < next_line_start:
+            continue
+        
+        line_start = text.rfind('\n', 0, start) + 1
+        line_end = text.find('\n', end)
+        if line_end == -1:
+            line_end = len(text)
+        next_line_start = line_end + 1
+        
+        yield text[line_start:line_end]
+
+
 def extract_tasks_stub(transcript_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     Stub implementation for task extraction.
@@ -102,37 +193,28 @@ def extract_tasks_stub(transcript_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     # Parse transcript for action items (simple keyword-based stub)
     tasks = []
     
-    # Look for common action indicators
-    action_keywords = [
-        'TODO', 'ACTION ITEM', 'TASK', 'NEED TO', 'SHOULD', 
-        'UPDATE', 'FIX', 'IMPLEMENT', 'CREATE', 'ADD'
-    ]
-    
-    # Simple line-by-line parsing (stub logic)
-    lines = transcript_text.split('\n')
+    # Scan the whole transcript once and take each line with a keyword match
     task_id_counter = 1
     
-    for line in lines:
-        line_upper = line.upper()
-        if any(keyword in line_upper for keyword in action_keywords):
-            # Extract a simple task (this is just demonstration logic)
-            task = {
-                "task_id": f"{meeting_id}_TASK_{task_id_counter:03d}",
-                "agent": "A-01",  # Default agent (would be determined by LLM)
-                "repo": "PR-CYBR-AGENT-01",  # Default repo
-                "title": line.strip()[:100],  # First 100 chars
-                "description": line.strip(),
-                "priority": "medium",  # Default priority
-                "type": "enhancement",  # Default type
-                "labels": ["automation/codex", f"meeting/{meeting_id}"],
-                "explicit": False  # False = inferred, True = explicitly stated
-            }
-            tasks.append(task)
-            task_id_counter += 1
-            
-            # Limit to 10 tasks in stub mode
-            if task_id_counter > 10:
-                break
+    for line in iter_action_lines(transcript_text):
+        # Extract a simple task (this is just demonstration logic)
+        task = {
+            "task_id": f"{meeting_id}_TASK_{task_id_counter:03d}",
+            "agent": "A-01",  # Default agent (would be determined by LLM)
+            "repo": "PR-CYBR-AGENT-01",  # Default repo
+            "title": line.strip()[:100],  # First 100 chars
+            "description": line.strip(),
+            "priority": "medium",  # Default priority
+            "type": "enhancement",  # Default type
+            "labels": ["automation/codex", f"meeting/{meeting_id}"],
+            "explicit": False  # False = inferred, True = explicitly stated
+        }
+        tasks.append(task)
+        task_id_counter += 1
+        
+        # Limit to 10 tasks in stub mode
+        if task_id_counter > 10:
+            break
     
     logger.info(f"Extracted {len(tasks)} tasks (stub mode)")
     return tasks
@@ -185,28 +267,106 @@ def save_tasks(output_path: Path, meeting_id: str, summary: str, tasks: List[Dic
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # orjson emits UTF-8 directly, without ASCII escaping, in one pass
+        output_path.write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, indent=2, ensure_ascii=False)
     
     logger.info(f"Successfully saved tasks to {output_path}")
 
 
+def process_single(input_path: Path, output_path: Path) -> Tuple[str, int]:
+    """
+    Extract tasks from one transcript file and save them.
+    
+    Args:
+        input_path: Path to input JSON file containing transcript data
+        output_path: Path to output JSON file for extracted tasks
+        
+    Returns:
+        Tuple of (meeting_id, number of extracted tasks)
+    """
+    # Load transcript
+    transcript_data = load_transcript(input_path)
+    
+    # Extract tasks using LLM
+    tasks = extract_tasks_with_llm(transcript_data)
+    
+    # Generate summary
+    meeting_id = transcript_data.get('meeting_id', 'unknown')
+    summary = generate_summary(transcript_data, tasks)
+    
+    # Save tasks to output file
+    save_tasks(output_path, meeting_id, summary, tasks)
+    
+    return meeting_id, len(tasks)
+
+
+def process_directory(input_dir: Path, output_dir: Path) -> int:
+    """
+    Extract tasks from every transcript in a directory in parallel.
+    
+    Each *.json transcript is processed in a worker process and saved under
+    output_dir with the same file name.
+    
+    Args:
+        input_dir: Directory containing transcript JSON files
+        output_dir: Directory for extracted task files
+        
+    Returns:
+        Number of transcripts that failed
+    """
+    if not input_dir.is_dir():
+        raise FileNotFoundError(f"Input directory not found: {input_dir}")
+    if output_dir.resolve() == input_dir.resolve():
+        raise ValueError("Output directory must differ from the input directory")
+    
+    input_paths = sorted(input_dir.glob('*.json'))
+    logger.info(f"Processing {len(input_paths)} transcripts from {input_dir}")
+    
+    failures = 0
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            path: executor.submit(process_single, path, output_dir / path.name)
+            for path in input_paths
+        }
+        
+        for path, future in futures.items():
+            try:
+                meeting_id, task_count = future.result()
+                print(f"✅ Extracted {task_count} tasks from meeting {meeting_id} ({path.name})")
+            except Exception as e:
+                logger.error(f"Error processing {path}: {e}")
+                print(f"❌ Error in {path.name}: {e}", file=sys.stderr)
+                failures += 1
+    
+    print(f"📄 Tasks for {len(input_paths) - failures}/{len(input_paths)} transcripts saved to: {output_dir}")
+    return failures
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(
         description='Extract actionable tasks from meeting transcripts'
     )
-    parser.add_argument(
+    input_group = parser.add_mutually_exclusive_group(required=True)
+    input_group.add_argument(
         '--input',
         type=Path,
-        required=True,
         help='Path to input JSON file containing transcript data'
     )
+    input_group.add_argument(
+        '--input-dir',
+        type=Path,
+        help='Directory of transcript JSON files to process in parallel'
+    )
     parser.add_argument(
         '--output',
         type=Path,
         required=True,
-        help='Path to output JSON file for extracted tasks'
+        help='Path to output JSON file for extracted tasks (a directory with --input-dir)'
     )
     parser.add_argument(
         '--verbose',
@@ -220,21 +380,14 @@ def main():
         logger.setLevel(logging.DEBUG)
     
     try:
-        # Load transcript
-        transcript_data = load_transcript(args.input)
-        
-        # Extract tasks using LLM
-        tasks = extract_tasks_with_llm(transcript_data)
-        
-        # Generate summary
-        meeting_id = transcript_data.get('meeting_id', 'unknown')
-        summary = generate_summary(transcript_data, tasks)
+        if args.input_dir:
+            failures = process_directory(args.input_dir, args.output)
+            return 0 if failures == 0 else 1
         
-        # Save tasks to output file
-        save_tasks(args.output, meeting_id, summary, tasks)
+        meeting_id, task_count = process_single(args.input, args.output)
         
         # Print summary to stdout
-        print(f"✅ Successfully extracted {len(tasks)} tasks from meeting {meeting_id}")
+        print(f"✅ Successfully extracted {task_count} tasks from meeting {meeting_id}")
         print(f"📄 Tasks saved to: {args.output}")
         
         return 0
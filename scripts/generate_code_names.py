@@ -8,11 +8,18 @@ Format: P0D-S<season>-E<episode>-AXIS-<symbol>
 This script can be re-run to regenerate or reassign code names programmatically.
 """
 
+import itertools
 import json
 import random
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
 
 # Configuration
 EPISODES_PER_SEASON = 52
@@ -56,8 +63,15 @@ SYMBOL_SETS = {
     ]
 }
 
+# Reverse index used to tag each pooled symbol with its category
+_SYMBOL_TO_CATEGORY = {
+    symbol: category
+    for category, symbols in SYMBOL_SETS.items()
+    for symbol in symbols
+}
+
 
-def generate_symbol_pool(seasons: int, episodes_per_season: int) -> List[str]:
+def generate_symbol_pool(seasons: int, episodes_per_season: int) -> List[Tuple[str, str]]:
     """
     Generate a pool of unique symbols for all episodes.
     
@@ -66,54 +80,34 @@ def generate_symbol_pool(seasons: int, episodes_per_season: int) -> List[str]:
         episodes_per_season: Episodes per season
         
     Returns:
-        List of symbol names
+        List of tuples (symbol, category)
     """
     total_episodes = seasons * episodes_per_season
-    symbol_pool = []
-    
-    # Flatten all symbols into a single list
-    all_symbols = []
-    for category_symbols in SYMBOL_SETS.values():
-        all_symbols.extend(category_symbols)
     
-    # Remove duplicates and sort
-    all_symbols = sorted(set(all_symbols))
+    # Flatten all symbols into a single sorted list without duplicates
+    all_symbols = sorted({symbol for symbols in SYMBOL_SETS.values() for symbol in symbols})
     
-    # If we need more symbols than available, reuse with numeric suffixes
-    if total_episodes > len(all_symbols):
-        for i in range(total_episodes):
-            base_symbol = all_symbols[i % len(all_symbols)]
-            suffix_num = i // len(all_symbols)
-            if suffix_num > 0:
-                symbol_pool.append(f"{base_symbol}{suffix_num}")
-            else:
-                symbol_pool.append(base_symbol)
-    else:
-        symbol_pool = all_symbols[:total_episodes]
+    # If we need more symbols than available, reuse with numeric suffixes:
+    # each full round over the list gets its round number as a suffix
+    full_rounds, remainder = divmod(total_episodes, len(all_symbols))
+    symbol_pool = [
+        (f"{symbol}{round_num}" if round_num else symbol, _SYMBOL_TO_CATEGORY[symbol])
+        for round_num in range(full_rounds)
+        for symbol in all_symbols
+    ]
+    symbol_pool.extend(
+        (f"{symbol}{full_rounds}" if full_rounds else symbol, _SYMBOL_TO_CATEGORY[symbol])
+        for symbol in all_symbols[:remainder]
+    )
     
     return symbol_pool
 
 
-def generate_code_name(season: int, episode: int, symbol: str) -> str:
-    """
-    Generate a code name for an episode.
-    
-    Args:
-        season: Season number
-        episode: Episode number
-        symbol: Symbol/theme word
-        
-    Returns:
-        Formatted code name
-    """
-    return f"{CODE_PREFIX}-S{season:02d}-E{episode:03d}-{CODE_THEME}-{symbol}"
-
-
 def generate_all_code_names(
     seasons: int = TOTAL_SEASONS,
     episodes_per_season: int = EPISODES_PER_SEASON,
     randomize: bool = False
-) -> List[Tuple[int, int, str, str]]:
+) -> List[Tuple[int, int, str, str, str]]:
     """
     Generate code names for all episodes.
     
@@ -123,28 +117,29 @@ def generate_all_code_names(
         randomize: Whether to randomize symbol assignment
         
     Returns:
-        List of tuples (season, episode, code_name, symbol)
+        List of tuples (season, episode, code_name, symbol, category)
     """
     symbols = generate_symbol_pool(seasons, episodes_per_season)
     
     if randomize:
         random.shuffle(symbols)
     
-    code_names = []
-    symbol_index = 0
-    
-    for season in range(1, seasons + 1):
-        for episode in range(1, episodes_per_season + 1):
-            symbol = symbols[symbol_index]
-            code_name = generate_code_name(season, episode, symbol)
-            code_names.append((season, episode, code_name, symbol))
-            symbol_index += 1
+    slots = itertools.product(range(1, seasons + 1), range(1, episodes_per_season + 1))
     
-    return code_names
+    return [
+        (
+            season,
+            episode,
+            f"{CODE_PREFIX}-S{season:02d}-E{episode:03d}-{CODE_THEME}-{symbol}",
+            symbol,
+            category
+        )
+        for (season, episode), (symbol, category) in zip(slots, symbols)
+    ]
 
 
 def save_code_names(
-    code_names: List[Tuple[int, int, str, str]],
+    code_names: List[Tuple[int, int, str, str, str]],
     output_dir: Path
 ) -> None:
     """
@@ -170,38 +165,45 @@ def save_code_names(
                 "code_name": code_name,
                 "symbol": symbol
             }
-            for season, episode, code_name, symbol in code_names
+            for season, episode, code_name, symbol, _ in code_names
         ]
     }
     
-    with open(json_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        json_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_file, 'w') as f:
+            json.dump(data, f, indent=2)
+    
+    # Save as text, built in memory and written in one call
+    parts = [
+        "PR-CYBR-P0D Episode Code Names\n",
+        "=" * 70 + "\n",
+        "Format: P0D-S<season>-E<episode>-AXIS-<symbol>\n",
+        "=" * 70 + "\n\n",
+    ]
+    
+    current_season = None
+    for season, episode, code_name, _, _ in code_names:
+        if season != current_season:
+            if current_season is not None:
+                parts.append("\n")
+            parts.append(f"Season {season}\n")
+            parts.append("-" * 70 + "\n")
+            current_season = season
+        
+        parts.append(f"E{episode:03d}: {code_name}\n")
+    
+    parts.append("\n" + "=" * 70 + "\n")
+    parts.append(f"Total Episodes: {len(code_names)}\n")
+    parts.append("=" * 70 + "\n")
     
-    # Save as text
     txt_file = output_dir / "episode-code-names.txt"
     with open(txt_file, 'w') as f:
-        f.write("PR-CYBR-P0D Episode Code Names\n")
-        f.write("=" * 70 + "\n")
-        f.write("Format: P0D-S<season>-E<episode>-AXIS-<symbol>\n")
-        f.write("=" * 70 + "\n\n")
-        
-        current_season = None
-        for season, episode, code_name, symbol in code_names:
-            if season != current_season:
-                if current_season is not None:
-                    f.write("\n")
-                f.write(f"Season {season}\n")
-                f.write("-" * 70 + "\n")
-                current_season = season
-            
-            f.write(f"E{episode:03d}: {code_name}\n")
-        
-        f.write("\n" + "=" * 70 + "\n")
-        f.write(f"Total Episodes: {len(code_names)}\n")
-        f.write("=" * 70 + "\n")
+        f.write("".join(parts))
 
 
-def display_sample_codes(code_names: List[Tuple[int, int, str, str]], count: int = 10):
+def display_sample_codes(code_names: List[Tuple[int, int, str, str, str]], count: int = 10):
     """
     Display sample code names.
     
@@ -210,30 +212,23 @@ def display_sample_codes(code_names: List[Tuple[int, int, str, str]], count: int
         count: Number of samples to display
     """
     print("\n📋 Sample Code Names:")
-    for season, episode, code_name, symbol in code_names[:count]:
+    for season, episode, code_name, _, _ in code_names[:count]:
         print(f"   S{season:02d}E{episode:03d}: {code_name}")
 
 
-def display_symbol_distribution(code_names: List[Tuple[int, int, str, str]]):
+def display_symbol_distribution(code_names: List[Tuple[int, int, str, str, str]]):
     """
     Display symbol category distribution.
     
     Args:
         code_names: List of code name tuples
     """
-    # Count symbols by category
-    category_counts = {category: 0 for category in SYMBOL_SETS.keys()}
-    
-    for _, _, _, symbol in code_names:
-        # Find which category this symbol belongs to
-        for category, symbols in SYMBOL_SETS.items():
-            if any(s in symbol for s in symbols):
-                category_counts[category] += 1
-                break
+    # Count symbols by category (already attached to each code name)
+    category_counts = Counter(category for *_, category in code_names)
     
     print("\n📊 Symbol Distribution by Category:")
-    for category, count in sorted(category_counts.items()):
-        print(f"   {category.capitalize()}: {count} episodes")
+    for category in sorted(SYMBOL_SETS):
+        print(f"   {category.capitalize()}: {category_counts[category]} episodes")
 
 
 def main():
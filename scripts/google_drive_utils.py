@@ -6,11 +6,109 @@ Provides functions for creating Google Docs, storing files in Drive,
 and managing NotebookLM integrations.
 """
 
+import hashlib
 import os
 import json
-from typing import Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 from pathlib import Path
 
+from sync_utils import env_int
+
+
+# Default number of parallel Drive uploads (override with PR_CYBR_P0D_DRIVE_CONCURRENCY)
+DEFAULT_DRIVE_CONCURRENCY = 4
+
+# Retry settings for rate-limited or failed Drive requests
+MAX_RETRIES = 3
+RETRY_BACKOFF = 2  # seconds, doubled on each attempt
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+# Drive also answers 403 for quota errors; other 403s are permission errors
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+# Requests per Drive batch call (larger batches frequently return HTTP 500)
+METADATA_BATCH_SIZE = 25
+METADATA_FIELDS = "id,name,size,mimeType"
+
+
+@dataclass(frozen=True, slots=True)
+class DriveConfig:
+    """Google Workspace settings, read from the environment once at import."""
+    
+    service_account_json: Optional[str] = os.environ.get("GOOGLE_DRIVE_SERVICE_ACCOUNT")
+    folder_id: Optional[str] = os.environ.get("PR_CYBR_P0D_DRIVE_FOLDER_ID")
+    notebook_lm_key: Optional[str] = os.environ.get("NOTEBOOK_LM_API_KEY")
+    drive_concurrency: int = env_int(
+        "PR_CYBR_P0D_DRIVE_CONCURRENCY", DEFAULT_DRIVE_CONCURRENCY
+    )
+
+
+DRIVE_CONFIG = DriveConfig()
+
+
+def _mock_id(prefix: str, value: str) -> str:
+    """
+    Build a mock resource ID that is stable across processes.
+    
+    Unlike hash(), blake2b is not salted per interpreter run.
+    
+    Args:
+        prefix: ID prefix (e.g., 'doc')
+        value: Value to derive the ID from
+        
+    Returns:
+        Mock ID such as 'doc_0042'
+    """
+    digest = hashlib.blake2b(value.encode('utf-8'), digest_size=2).digest()
+    return f"{prefix}_{int.from_bytes(digest, 'big') % 10000:04d}"
+
+
+def _retryable_status(error: Exception) -> Optional[int]:
+    """
+    Return the HTTP status of a retryable Drive API error.
+    
+    Args:
+        error: Exception raised by a Drive API call
+        
+    Returns:
+        HTTP status code if the error should be retried, otherwise None
+    """
+    # googleapiclient's HttpError exposes the response as `resp`
+    status = getattr(getattr(error, "resp", None), "status", None)
+    try:
+        status = int(status)
+    except (TypeError, ValueError):
+        return None
+    if status == 403:
+        return status if _error_reasons(error) & RATE_LIMIT_REASONS else None
+    return status if status in RETRYABLE_STATUSES else None
+
+
+def _error_reasons(error: Exception) -> set:
+    """
+    Return the error reasons reported in a Drive API error response.
+    
+    Args:
+        error: Exception raised by a Drive API call
+        
+    Returns:
+        Set of reason strings (e.g. 'rateLimitExceeded'), empty if none
+    """
+    details = getattr(error, "error_details", None)
+    if not isinstance(details, list):
+        # Fall back to the raw JSON body: {"error": {"errors": [{"reason": ...}]}}
+        try:
+            details = json.loads(getattr(error, "content", b"") or b"{}")["error"]["errors"]
+        except (TypeError, ValueError, KeyError):
+            return set()
+    return {
+        detail["reason"]
+        for detail in details
+        if isinstance(detail, dict) and "reason" in detail
+    }
+
 
 class GoogleDriveClient:
     """Client for Google Drive API operations."""
@@ -22,10 +120,8 @@ class GoogleDriveClient:
         Args:
             service_account_json: Path or JSON string of service account credentials
         """
-        self.service_account_json = service_account_json or os.environ.get(
-            "GOOGLE_DRIVE_SERVICE_ACCOUNT"
-        )
-        self.drive_folder_id = os.environ.get("PR_CYBR_P0D_DRIVE_FOLDER_ID")
+        self.service_account_json = service_account_json or DRIVE_CONFIG.service_account_json
+        self.drive_folder_id = DRIVE_CONFIG.folder_id
         
         # Note: Actual Google API client initialization would go here
         # For now, this is a placeholder structure
@@ -56,7 +152,7 @@ class GoogleDriveClient:
             print(f"   Using template: {template_id}")
         
         # Mock response for testing
-        doc_id = f"doc_{hash(title) % 10000:04d}"
+        doc_id = _mock_id("doc", title)
         doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
         
         return {
@@ -84,7 +180,7 @@ class GoogleDriveClient:
         print(f"☁️  Uploading to Drive: {file_path.name}")
         
         # Mock response for testing
-        file_id = f"file_{hash(file_path.name) % 10000:04d}"
+        file_id = _mock_id("file", file_path.name)
         file_url = f"https://drive.google.com/file/d/{file_id}/view"
         
         return {
@@ -92,7 +188,66 @@ class GoogleDriveClient:
             "url": file_url
         }
     
-    def get_file_metadata(self, file_id: str) -> Dict:
+    def bulk_upload(
+        self,
+        file_paths: List[Path],
+        folder_id: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Upload several files to Google Drive in parallel.
+        
+        Drive's batch endpoint does not accept media uploads, so files are
+        uploaded concurrently from a thread pool instead.
+        
+        Args:
+            file_paths: Paths of files to upload
+            folder_id: Optional folder ID (uses default if not provided)
+            max_workers: Number of parallel uploads (defaults to
+                PR_CYBR_P0D_DRIVE_CONCURRENCY or DEFAULT_DRIVE_CONCURRENCY)
+            
+        Returns:
+            Upload results in the same order as file_paths
+        """
+        if max_workers is None:
+            max_workers = DRIVE_CONFIG.drive_concurrency
+        
+        if not file_paths:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(executor.map(
+                lambda path: self._upload_with_retry(path, folder_id),
+                file_paths
+            ))
+    
+    def _upload_with_retry(
+        self,
+        file_path: Path,
+        folder_id: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Upload a file, retrying rate-limit and server errors with backoff.
+        
+        Args:
+            file_path: Path to file to upload
+            folder_id: Optional folder ID
+            
+        Returns:
+            Dictionary with 'id' and 'url' of uploaded file
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return self.upload_to_drive(file_path, folder_id)
+            except Exception as e:
+                status = _retryable_status(e)
+                if status is None or attempt == MAX_RETRIES:
+                    raise
+                delay = RETRY_BACKOFF * (2 ** attempt)
+                print(f"⚠️  Drive returned {status} for {file_path.name}, retrying in {delay}s...")
+                time.sleep(delay)
+    
+    def get_file_metadata(self, file_id: str) -> Optional[Dict]:
         """
         Get metadata for a Drive file.
         
@@ -100,17 +255,60 @@ class GoogleDriveClient:
             file_id: Google Drive file ID
             
         Returns:
-            File metadata dictionary
+            File metadata dictionary, or None if the lookup failed
+        """
+        return self.get_files_metadata([file_id])[file_id]
+    
+    def get_files_metadata(self, file_ids: List[str]) -> Dict[str, Optional[Dict]]:
         """
-        print(f"📊 Getting metadata for file: {file_id}")
+        Get metadata for several Drive files.
         
-        # Mock response
-        return {
-            "id": file_id,
-            "name": "file.mp3",
-            "size": 10485760,  # 10 MB
-            "mimeType": "audio/mpeg"
-        }
+        With an API client, lookups are packed into Drive batch requests of
+        METADATA_BATCH_SIZE calls, so N files cost ceil(N / 25) round trips.
+        
+        Args:
+            file_ids: Google Drive file IDs
+            
+        Returns:
+            Dictionary mapping file ID to its metadata dictionary, or to None
+            for files whose lookup failed (e.g. missing or inaccessible)
+        """
+        print(f"📊 Getting metadata for {len(file_ids)} file(s)")
+        
+        if self.client is None:
+            # Mock response
+            return {
+                file_id: {
+                    "id": file_id,
+                    "name": "file.mp3",
+                    "size": 10485760,  # 10 MB
+                    "mimeType": "audio/mpeg"
+                }
+                for file_id in file_ids
+            }
+        
+        metadata: Dict[str, Optional[Dict]] = {}
+        # Batch request IDs must be unique
+        unique_ids = list(dict.fromkeys(file_ids))
+        
+        def _collect(request_id, response, exception):
+            # Record a failed lookup and keep the rest of the batch
+            if exception is not None:
+                print(f"⚠️  Could not get metadata for {request_id}: {exception}")
+                metadata[request_id] = None
+                return
+            metadata[request_id] = response
+        
+        for start in range(0, len(unique_ids), METADATA_BATCH_SIZE):
+            batch = self.client.new_batch_http_request(callback=_collect)
+            for file_id in unique_ids[start:start + METADATA_BATCH_SIZE]:
+                batch.add(
+                    self.client.files().get(fileId=file_id, fields=METADATA_FIELDS),
+                    request_id=file_id
+                )
+            batch.execute()
+        
+        return metadata
 
 
 class NotebookLMClient:
@@ -123,7 +321,7 @@ class NotebookLMClient:
         Args:
             api_key: NotebookLM API key
         """
-        self.api_key = api_key or os.environ.get("NOTEBOOK_LM_API_KEY")
+        self.api_key = api_key or DRIVE_CONFIG.notebook_lm_key
         self.client = None
         
     def add_source_to_notebook(
@@ -145,7 +343,7 @@ class NotebookLMClient:
         
         # Mock response
         return {
-            "source_id": f"source_{hash(document_id) % 10000:04d}",
+            "source_id": _mock_id("source", document_id),
             "status": "added"
         }
     
@@ -167,7 +365,7 @@ class NotebookLMClient:
         print(f"🎙️  Generating audio overview for notebook {notebook_id}")
         
         # Mock response
-        audio_id = f"audio_{hash(notebook_id) % 10000:04d}"
+        audio_id = _mock_id("audio", notebook_id)
         audio_url = f"https://notebooklm.google.com/audio/{audio_id}.{output_format}"
         
         return {
@@ -19,15 +19,12 @@ import json
 import logging
 import os
 import sys
-import uuid
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
-try:
-    from notion_client import Client
-except ImportError:
-    print("Error: notion-client library not found. Install with: pip install notion-client", file=sys.stderr)
-    sys.exit(1)
+from sync_utils import NOTION_MAX_RETRIES, retry_delay
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +33,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Notion allows at most 100 conditions in a compound filter and 100 results per page
+QUERY_BATCH_SIZE = 100
+
+# Parallel writes in bulk_upsert, matching Notion's ~3 requests/second limit
+BULK_UPSERT_WORKERS = 3
+
+# Shared HTTP connection pool for Notion API requests
+HTTP_TIMEOUT = 30.0  # seconds
+HTTP_MAX_CONNECTIONS = 20
+
+# C-accelerated ISO-8601 parser for YYYY-MM-DD meeting dates
+_parse_iso_datetime = datetime.fromisoformat
+
+
+def property_value(prop: Optional[Dict[str, Any]]) -> Any:
+    """
+    Reduce a Notion property to a plain value for comparison.
+    
+    Works for both property payloads sent to the API and properties
+    returned in query results.
+    
+    Args:
+        prop: Notion property dictionary
+        
+    Returns:
+        Text, select name, number, URL or date (YYYY-MM-DD), or None
+    """
+    if not prop:
+        return None
+    
+    for key in ('title', 'rich_text'):
+        if key in prop:
+            return ''.join(
+                item.get('plain_text', item.get('text', {}).get('content', ''))
+                for item in prop[key] or []
+            )
+    if 'select' in prop:
+        return (prop['select'] or {}).get('name')
+    if 'date' in prop:
+        return ((prop['date'] or {}).get('start') or '')[:10]
+    for key in ('number', 'url'):
+        if key in prop:
+            return prop[key]
+    return None
+
 
 class NotionSync:
     """Handles synchronization of meeting results to Notion."""
@@ -47,11 +89,78 @@ class NotionSync:
         Args:
             token: Notion integration token
             database_id: Target database ID
+            
+        Raises:
+            RuntimeError: If the notion-client library is not installed
         """
-        self.client = Client(auth=token)
+        # Imported here so --help and ID generation work without the SDK
+        try:
+            import httpx
+            from notion_client import Client
+        except ImportError as e:
+            raise RuntimeError(
+                "notion-client library not found. Install with: pip install notion-client"
+            ) from e
+        
+        # One pooled client for all requests; HTTP/2 lets concurrent
+        # bulk_upsert writes share a connection when h2 is installed
+        limits = httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_CONNECTIONS
+        )
+        try:
+            self._http = httpx.Client(http2=True, timeout=HTTP_TIMEOUT, limits=limits)
+        except ImportError:
+            self._http = httpx.Client(timeout=HTTP_TIMEOUT, limits=limits)
+        
+        # notion_client resets the injected client's timeout to timeout_ms
+        self.client = Client(
+            auth=token,
+            client=self._http,
+            timeout_ms=int(HTTP_TIMEOUT * 1000)
+        )
         self.database_id = database_id
+        # Page IDs by deterministic ID (None when known not to exist), and
+        # hash of the last properties written per page
+        self._page_cache: Dict[str, Optional[str]] = {}
+        self._payload_hashes: Dict[str, str] = {}
+        # Properties of existing pages as returned by database queries
+        self._page_properties: Dict[str, Dict[str, Any]] = {}
         logger.info(f"Initialized Notion sync for database {database_id}")
     
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+    
+    def __enter__(self) -> 'NotionSync':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _call(self, method, idempotent: bool = True, **kwargs) -> Any:
+        """
+        Call a Notion API method, retrying rate limits and server errors.
+        
+        Args:
+            method: Bound Notion client method (e.g., self.client.pages.update)
+            idempotent: False for calls such as pages.create that must not be
+                repeated after a server error (only rate limits are retried)
+            **kwargs: Arguments passed to the method
+            
+        Returns:
+            The method's response
+        """
+        for attempt in range(NOTION_MAX_RETRIES + 1):
+            try:
+                return method(**kwargs)
+            except Exception as e:
+                delay = retry_delay(e, attempt, idempotent)
+                if delay is None or attempt == NOTION_MAX_RETRIES:
+                    raise
+                logger.warning(f"Notion API error ({e}), retrying in {delay:.0f}s...")
+                time.sleep(delay)
+    
     def generate_deterministic_id(self, agent: str, repo: str, issue: int, meeting_date: str) -> str:
         """
         Generate a deterministic UUID based on task identifiers.
@@ -71,14 +180,13 @@ class NotionSync:
         # Create a stable string representation
         identifier = f"{agent}:{repo}:{issue}:{meeting_date}"
         
-        # Generate UUID from hash
-        hash_obj = hashlib.sha256(identifier.encode('utf-8'))
-        hash_hex = hash_obj.hexdigest()
-        
-        # Convert to UUID (using first 32 hex characters)
-        deterministic_uuid = str(uuid.UUID(hash_hex[:32]))
+        # Format the first 16 bytes of the hash as a UUID (SHA-256 is kept so
+        # IDs of pages created by earlier runs still match); hex-encoding only
+        # those bytes skips building the full 64-character hexdigest
+        d = hashlib.sha256(identifier.encode('utf-8')).digest()[:16].hex()
+        deterministic_uuid = f"{d[0:8]}-{d[8:12]}-{d[12:16]}-{d[16:20]}-{d[20:32]}"
         
-        logger.debug(f"Generated deterministic ID: {deterministic_uuid} for {identifier}")
+        logger.debug("Generated deterministic ID: %s for %s", deterministic_uuid, identifier)
         return deterministic_uuid
     
     def search_existing_page(self, deterministic_id: str) -> Optional[str]:
@@ -91,11 +199,15 @@ class NotionSync:
         Returns:
             Page ID if found, None otherwise
         """
+        if deterministic_id in self._page_cache:
+            return self._page_cache[deterministic_id]
+        
         logger.info(f"Searching for existing page with ID: {deterministic_id}")
         
         try:
             # Search for pages with matching deterministic ID in a custom property
-            results = self.client.databases.query(
+            results = self._call(
+                self.client.databases.query,
                 database_id=self.database_id,
                 filter={
                     "property": "Task ID",
@@ -106,8 +218,11 @@ class NotionSync:
             )
             
             if results.get('results'):
-                page_id = results['results'][0]['id']
+                page = results['results'][0]
+                page_id = page['id']
                 logger.info(f"Found existing page: {page_id}")
+                self._page_cache[deterministic_id] = page_id
+                self._page_properties[page_id] = page.get('properties', {})
                 return page_id
             
             logger.info("No existing page found")
@@ -117,6 +232,60 @@ class NotionSync:
             logger.warning(f"Error searching for existing page: {e}")
             return None
     
+    def find_existing_pages(self, deterministic_ids: List[str]) -> Dict[str, str]:
+        """
+        Look up existing pages for many deterministic IDs at once.
+        
+        IDs are queried in groups of QUERY_BATCH_SIZE using an "or" filter,
+        so N lookups cost ceil(N / 100) queries instead of N.
+        
+        Args:
+            deterministic_ids: Deterministic UUIDs to search for
+            
+        Returns:
+            Dictionary mapping deterministic ID to page ID for pages that exist
+        """
+        missing = [
+            deterministic_id for deterministic_id in dict.fromkeys(deterministic_ids)
+            if deterministic_id not in self._page_cache
+        ]
+        
+        for start in range(0, len(missing), QUERY_BATCH_SIZE):
+            batch = missing[start:start + QUERY_BATCH_SIZE]
+            logger.info(f"Searching for {len(batch)} existing page(s)")
+            query = {
+                "database_id": self.database_id,
+                "filter": {
+                    "or": [
+                        {"property": "Task ID", "rich_text": {"equals": deterministic_id}}
+                        for deterministic_id in batch
+                    ]
+                },
+                "page_size": QUERY_BATCH_SIZE
+            }
+            
+            while True:
+                results = self._call(self.client.databases.query, **query)
+                for page in results.get('results', []):
+                    rich_text = page['properties'].get('Task ID', {}).get('rich_text', [])
+                    if rich_text:
+                        self._page_cache.setdefault(rich_text[0]['plain_text'], page['id'])
+                        self._page_properties[page['id']] = page['properties']
+                
+                if not results.get('has_more'):
+                    break
+                query['start_cursor'] = results['next_cursor']
+            
+            # Remember misses so upsert does not query them again
+            for deterministic_id in batch:
+                self._page_cache.setdefault(deterministic_id, None)
+        
+        return {
+            deterministic_id: self._page_cache[deterministic_id]
+            for deterministic_id in deterministic_ids
+            if self._page_cache.get(deterministic_id)
+        }
+    
     def format_properties(
         self,
         deterministic_id: str,
@@ -144,7 +313,7 @@ class NotionSync:
         """
         # Parse meeting date
         try:
-            meeting_datetime = datetime.strptime(meeting_date, '%Y-%m-%d')
+            meeting_datetime = _parse_iso_datetime(meeting_date)
         except ValueError:
             meeting_datetime = datetime.utcnow()
             logger.warning(f"Invalid date format: {meeting_date}, using current date")
@@ -190,6 +359,47 @@ class NotionSync:
         
         return properties
     
+    def _page_unchanged(self, page_id: str, properties: Dict[str, Any]) -> bool:
+        """
+        Check whether a page already holds the given properties.
+        
+        Uses the hash of the last payload written by this process, or the
+        page's properties from the query that found it, so no extra API
+        read is needed.
+        
+        Args:
+            page_id: Notion page ID
+            properties: Properties that would be written
+            
+        Returns:
+            True if writing the properties would not change the page
+        """
+        if self._payload_hashes.get(page_id) == self.payload_hash(properties):
+            return True
+        
+        existing = self._page_properties.get(page_id)
+        if not existing:
+            return False
+        
+        return all(
+            property_value(existing.get(name)) == property_value(prop)
+            for name, prop in properties.items()
+        )
+    
+    @staticmethod
+    def payload_hash(properties: Dict[str, Any]) -> str:
+        """
+        Hash a properties payload to detect redundant updates.
+        
+        Args:
+            properties: Notion properties dictionary
+            
+        Returns:
+            Hex digest of the canonical JSON payload
+        """
+        payload = json.dumps(properties, sort_keys=True).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
     def create_page(
         self,
         deterministic_id: str,
@@ -221,12 +431,17 @@ class NotionSync:
             deterministic_id, agent, repo, issue, pr, meeting_date, summary
         )
         
-        response = self.client.pages.create(
+        # A 5xx may arrive after the page was created, so only 429s are retried
+        response = self._call(
+            self.client.pages.create,
+            idempotent=False,
             parent={"database_id": self.database_id},
             properties=properties
         )
         
         page_id = response['id']
+        self._page_cache[deterministic_id] = page_id
+        self._payload_hashes[page_id] = self.payload_hash(properties)
         logger.info(f"✅ Created page: {page_id}")
         return page_id
     
@@ -239,7 +454,8 @@ class NotionSync:
         issue: int,
         pr: Optional[int],
         meeting_date: str,
-        summary: str
+        summary: str,
+        properties: Optional[Dict[str, Any]] = None
     ) -> None:
         """
         Update an existing page in the Notion database.
@@ -253,17 +469,23 @@ class NotionSync:
             pr: Pull request number (optional)
             meeting_date: Meeting date
             summary: Task summary
+            properties: Already formatted properties for these values, if
+                the caller built them (skips formatting them again)
         """
         logger.info(f"Updating existing page: {page_id}")
         
-        properties = self.format_properties(
-            deterministic_id, agent, repo, issue, pr, meeting_date, summary
-        )
+        if properties is None:
+            properties = self.format_properties(
+                deterministic_id, agent, repo, issue, pr, meeting_date, summary
+            )
         
-        self.client.pages.update(
+        self._call(
+            self.client.pages.update,
             page_id=page_id,
             properties=properties
         )
+        self._payload_hashes[page_id] = self.payload_hash(properties)
+        self._page_properties[page_id] = properties
         
         logger.info(f"✅ Updated page: {page_id}")
     
@@ -274,7 +496,8 @@ class NotionSync:
         issue: int,
         pr: Optional[int],
         meeting_date: str,
-        summary: str
+        summary: str,
+        skip_if_unchanged: bool = True
     ) -> Dict[str, Any]:
         """
         Upsert (create or update) a page in the Notion database.
@@ -286,6 +509,8 @@ class NotionSync:
             pr: Pull request number (optional)
             meeting_date: Meeting date
             summary: Task summary
+            skip_if_unchanged: Skip the write when the existing page
+                already holds the same values
             
         Returns:
             Result dictionary with status and page ID
@@ -297,9 +522,21 @@ class NotionSync:
         existing_page = self.search_existing_page(deterministic_id)
         
         if existing_page:
+            properties = self.format_properties(
+                deterministic_id, agent, repo, issue, pr, meeting_date, summary
+            )
+            if skip_if_unchanged and self._page_unchanged(existing_page, properties):
+                logger.info(f"Skipping unchanged page: {existing_page}")
+                return {
+                    'status': 'unchanged',
+                    'page_id': existing_page,
+                    'deterministic_id': deterministic_id
+                }
+            
             # Update existing page
             self.update_page(
-                existing_page, deterministic_id, agent, repo, issue, pr, meeting_date, summary
+                existing_page, deterministic_id, agent, repo, issue, pr, meeting_date, summary,
+                properties=properties
             )
             return {
                 'status': 'updated',
@@ -318,6 +555,55 @@ class NotionSync:
             }
 
 
+    def bulk_upsert(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Upsert many pages with batched lookups and parallel writes.
+        
+        Existing pages are found with find_existing_pages, then creates and
+        updates run on a small thread pool. Tasks sharing a deterministic ID
+        are written sequentially so they cannot create duplicate pages.
+        
+        Args:
+            tasks: Dictionaries with agent, repo, issue, pr, meeting_date
+                and summary keys
+            
+        Returns:
+            Result dictionaries in the same order as tasks
+        """
+        # Group task indexes by deterministic ID
+        groups: Dict[str, List[int]] = {}
+        for index, task in enumerate(tasks):
+            deterministic_id = self.generate_deterministic_id(
+                task['agent'], task['repo'], task['issue'], task['meeting_date']
+            )
+            groups.setdefault(deterministic_id, []).append(index)
+        
+        self.find_existing_pages(list(groups))
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        
+        def _upsert_group(indexes: List[int]) -> None:
+            for index in indexes:
+                task = tasks[index]
+                try:
+                    results[index] = self.upsert(
+                        agent=task['agent'],
+                        repo=task['repo'],
+                        issue=task['issue'],
+                        pr=task.get('pr'),
+                        meeting_date=task['meeting_date'],
+                        summary=task['summary']
+                    )
+                except Exception as e:
+                    logger.error(f"Error upserting {task['agent']}/{task['repo']}#{task['issue']}: {e}")
+                    results[index] = {'status': 'error', 'error': str(e)}
+        
+        with ThreadPoolExecutor(max_workers=BULK_UPSERT_WORKERS) as executor:
+            list(executor.map(_upsert_group, groups.values()))
+        
+        return results
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(
@@ -380,18 +666,16 @@ def main():
         return 1
     
     try:
-        # Initialize Notion sync
-        notion = NotionSync(notion_token, notion_database_id)
-        
-        # Perform upsert
-        result = notion.upsert(
-            agent=args.agent,
-            repo=args.repo,
-            issue=args.issue,
-            pr=args.pr,
-            meeting_date=args.meeting_date,
-            summary=args.summary
-        )
+        # Initialize Notion sync and perform upsert
+        with NotionSync(notion_token, notion_database_id) as notion:
+            result = notion.upsert(
+                agent=args.agent,
+                repo=args.repo,
+                issue=args.issue,
+                pr=args.pr,
+                meeting_date=args.meeting_date,
+                summary=args.summary
+            )
         
         # Print result
         status = result['status']
@@ -399,6 +683,8 @@ def main():
         
         if status == 'created':
             print(f"✅ Created new Notion page: {page_id}")
+        elif status == 'unchanged':
+            print(f"⏭️  Notion page already up to date: {page_id}")
         else:
             print(f"✅ Updated existing Notion page: {page_id}")
         
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Shared Notion Client
+
+Provides the Notion API client used by the episode sync scripts.
+"""
+
+from notion_client import Client
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the SDK's stdlib json
+
+
+class NotionClient(Client):
+    """Notion client that decodes successful responses with orjson when available."""
+    
+    def _parse_response(self, response):
+        if orjson is not None and response.is_success:
+            return orjson.loads(response.content)
+        
+        # Errors (and the no-orjson case) keep the SDK's handling
+        return super()._parse_response(response)
@@ -22,57 +22,20 @@ START_DATE = datetime(2024, 1, 1, 6, 0)  # Default start date
 EPISODES_PER_SEASON = 52  # Default episodes per season
 TOTAL_SEASONS = 17
 
+# Days from each weekday (Monday=0) to the next release day strictly after it
+_NEXT_RELEASE_DELTA = tuple(
+    min((day - weekday) % 7 or 7 for day in RELEASE_DAYS)
+    for weekday in range(7)
+)
 
-def get_next_release_day(current_date: datetime) -> datetime:
-    """
-    Calculate the next release day (Monday, Wednesday, or Friday).
-    
-    Args:
-        current_date: Current date to calculate from
-        
-    Returns:
-        Next release date at 06:00 UTC
-    """
-    current_weekday = current_date.weekday()
-    
-    # Find the next release day
-    for day in RELEASE_DAYS:
-        if day > current_weekday:
-            days_ahead = day - current_weekday
-            next_date = current_date + timedelta(days=days_ahead)
-            return next_date.replace(hour=6, minute=0, second=0, microsecond=0)
-    
-    # If no release day found this week, get Monday of next week
-    days_ahead = (7 - current_weekday) + RELEASE_DAYS[0]
-    next_date = current_date + timedelta(days=days_ahead)
-    return next_date.replace(hour=6, minute=0, second=0, microsecond=0)
+# Separator lines for the schedule file
+_RULE = b"=" * 60 + b"\n"
+_SEASON_RULE = b"-" * 60 + b"\n"
 
-
-def generate_season_schedule(
-    season: int,
-    episodes: int,
-    start_date: datetime
-) -> List[Tuple[int, int, datetime]]:
-    """
-    Generate release schedule for a single season.
-    
-    Args:
-        season: Season number
-        episodes: Number of episodes in the season
-        start_date: Start date for the season
-        
-    Returns:
-        List of tuples (season, episode, release_date)
-    """
-    schedule = []
-    current_date = start_date
-    
-    for episode in range(1, episodes + 1):
-        schedule.append((season, episode, current_date))
-        # Move to next release day
-        current_date = get_next_release_day(current_date + timedelta(days=1))
-    
-    return schedule
+# English weekday names by datetime.weekday(), independent of the locale
+_WEEKDAY_NAMES = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+)
 
 
 def generate_full_schedule(
@@ -91,20 +54,32 @@ def generate_full_schedule(
     Returns:
         List of tuples (season, episode, release_date)
     """
+    total_episodes = seasons * episodes_per_season
+    if total_episodes <= 0:
+        return []
+    
+    # Episode 1 airs on start_date; every later episode falls on the
+    # Monday/Wednesday/Friday cycle, so its date is a closed-form offset
+    # from the second release rather than a walk from the previous one
+    release_anchor = start_date.replace(hour=6, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    first_release = release_anchor + timedelta(days=_NEXT_RELEASE_DELTA[release_anchor.weekday()])
+    first_slot = RELEASE_DAYS.index(first_release.weekday())
+    slots_per_week = len(RELEASE_DAYS)
+    
+    release_dates = [start_date]
+    for index in range(first_slot, first_slot + total_episodes - 1):
+        weeks, slot = divmod(index, slots_per_week)
+        days_ahead = weeks * 7 + RELEASE_DAYS[slot] - RELEASE_DAYS[first_slot]
+        release_dates.append(first_release + timedelta(days=days_ahead))
+    
+    # Each season is a contiguous slice of the flat list of release dates
     full_schedule = []
-    current_date = start_date
-    
     for season in range(1, seasons + 1):
-        season_schedule = generate_season_schedule(
-            season,
-            episodes_per_season,
-            current_date
+        season_dates = release_dates[(season - 1) * episodes_per_season:season * episodes_per_season]
+        full_schedule.extend(
+            (season, episode, release_date)
+            for episode, release_date in enumerate(season_dates, start=1)
         )
-        full_schedule.extend(season_schedule)
-        
-        # Start next season after last episode of current season
-        if season_schedule:
-            current_date = get_next_release_day(season_schedule[-1][2] + timedelta(days=1))
     
     return full_schedule
 
@@ -121,11 +96,10 @@ def format_schedule_entry(season: int, episode: int, release_date: datetime) ->
     Returns:
         Formatted schedule string
     """
-    date_str = release_date.strftime("%Y-%m-%d")
-    time_str = release_date.strftime("%H:%M")
-    day_name = release_date.strftime("%A")
+    date_time = release_date.isoformat(" ", "minutes")[:16]
+    day_name = _WEEKDAY_NAMES[release_date.weekday()]
     
-    return f"S{season:02d}E{episode:03d} | {date_str} {time_str} UTC | {day_name}"
+    return f"S{season:02d}E{episode:03d} | {date_time} UTC | {day_name}"
 
 
 def save_schedule(
@@ -141,29 +115,41 @@ def save_schedule(
     """
     output_file.parent.mkdir(exist_ok=True)
     
-    with open(output_file, 'w') as f:
-        f.write("PR-CYBR-P0D Release Schedule\n")
-        f.write("=" * 60 + "\n")
-        f.write("Generated: " + datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC") + "\n")
-        f.write("Pattern: Monday/Wednesday/Friday at 06:00 UTC\n")
-        f.write("=" * 60 + "\n\n")
-        
-        current_season = None
-        for season, episode, release_date in schedule:
-            # Add season header when season changes
-            if season != current_season:
-                if current_season is not None:
-                    f.write("\n")
-                f.write(f"Season {season}\n")
-                f.write("-" * 60 + "\n")
-                current_season = season
-            
-            f.write(format_schedule_entry(season, episode, release_date) + "\n")
+    parts = [
+        b"PR-CYBR-P0D Release Schedule\n",
+        _RULE,
+        b"Generated: " + datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC").encode("ascii") + b"\n",
+        b"Pattern: Monday/Wednesday/Friday at 06:00 UTC\n",
+        _RULE,
+        b"\n"
+    ]
+    
+    current_season = None
+    for season, episode, release_date in schedule:
+        # Add season header when season changes
+        if season != current_season:
+            if current_season is not None:
+                parts.append(b"\n")
+            parts.append(f"Season {season}\n".encode("ascii"))
+            parts.append(_SEASON_RULE)
+            current_season = season
         
-        f.write("\n" + "=" * 60 + "\n")
-        f.write(f"Total Episodes: {len(schedule)}\n")
-        f.write(f"Total Seasons: {TOTAL_SEASONS}\n")
-        f.write("=" * 60 + "\n")
+        parts.append(format_schedule_entry(season, episode, release_date).encode("ascii") + b"\n")
+    
+    parts.extend([
+        b"\n",
+        _RULE,
+        f"Total Episodes: {len(schedule)}\n".encode("ascii"),
+        f"Total Seasons: {TOTAL_SEASONS}\n".encode("ascii"),
+        _RULE
+    ])
+    
+    # The schedule is ASCII-only, so write pre-encoded bytes. Writing to a
+    # temporary file and renaming it means readers never see a partial file.
+    tmp_file = output_file.with_suffix(output_file.suffix + ".tmp")
+    with tmp_file.open("wb") as f:
+        f.writelines(parts)
+    os.replace(tmp_file, output_file)
 
 
 def main():
@@ -10,16 +10,29 @@ downloads their MP3 files, and commits them to the episodes directory.
 import os
 import sys
 import json
+import re
 import time
 import hashlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
 import requests
-from notion_client import Client
+from requests.adapters import HTTPAdapter
+from notion_client.helpers import iterate_paginated_api
 from slugify import slugify
 
+from notion_utils import NotionClient
+from sync_utils import env_int
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to stdlib json
+
 
 # Configuration
 NOTION_TOKEN = os.environ.get("NOTION_TOKEN")
@@ -27,12 +40,64 @@ NOTION_DATABASE_ID = os.environ.get("NOTION_DATABASE_ID")
 EPISODES_DIR = Path("episodes")
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB reads from the response
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024  # 8 MiB file buffer
+SYNC_CONCURRENCY = env_int("PR_CYBR_P0D_SYNC_CONCURRENCY", 8)
+CONNECTION_POOL_SIZE = max(20, SYNC_CONCURRENCY)
+
+# Serializes output from concurrent download workers
+_print_lock = threading.Lock()
+
+
+# Query filter for episodes marked live, built once and reused for every query
+_LIVE_FILTER = {
+    "property": "Episode Live",
+    "checkbox": {
+        "equals": True
+    }
+}
+
+# Runs of characters a slug replaces with a single dash
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Input slugify treats specially (HTML entities, thousands separators)
+_SLUG_FALLBACK_RE = re.compile(r"&|\d,\d")
+
+
+def _log(message: str) -> None:
+    """Print a message without interleaving output from other threads."""
+    with _print_lock:
+        print(message)
+
+
+def fast_slug(title: str) -> str:
+    """
+    Slugify a title, matching python-slugify's output.
+
+    Plain ASCII titles take a single regex pass; anything needing
+    transliteration or entity decoding goes through slugify itself, so
+    existing episode filenames never change.
+
+    Args:
+        title: Episode title
+
+    Returns:
+        Lowercase, dash-separated slug
+    """
+    if title.isascii() and not _SLUG_FALLBACK_RE.search(title):
+        slug = _SLUG_RE.sub("-", title.lower()).strip("-")
+        if slug:
+            return slug
+    return slugify(title)
 
 
+@functools.cache
 def get_season_database_ids() -> List[str]:
     """
     Get all season-specific database IDs from environment variables.
     
+    The environment is read once per process; later calls reuse the result.
+    
     Returns:
         List of database IDs for all configured seasons
     """
@@ -66,10 +131,21 @@ class NotionEpisodeSync:
             token: Notion API integration token
             database_id: ID of the pr-cyberpod Notion database
         """
-        self.client = Client(auth=token)
+        self.client = NotionClient(auth=token)
         self.database_id = database_id
         self.episodes_dir = EPISODES_DIR
         self.episodes_dir.mkdir(exist_ok=True)
+        # Base names of downloaded episodes, filled in by sync()
+        self._existing = None
+        
+        # Pooled session so downloads reuse TCP/TLS connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=CONNECTION_POOL_SIZE,
+            pool_maxsize=CONNECTION_POOL_SIZE
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def get_live_episodes(self) -> List[Dict]:
         """
@@ -78,31 +154,37 @@ class NotionEpisodeSync:
         Returns:
             List of episode dictionaries with metadata
         """
-        print("🔍 Querying Notion database for live episodes...")
+        return list(self.iter_live_episodes())
+
+    def iter_live_episodes(self) -> Iterator[Dict]:
+        """
+        Yield live episodes as each page of query results is parsed.
+
+        Yields:
+            Episode dictionaries with metadata
+        """
+        _log("🔍 Querying Notion database for live episodes...")
         
+        found = 0
         try:
-            response = self.client.databases.query(
+            # Follow next_cursor so databases with more than 100 episodes are complete
+            pages = iterate_paginated_api(
+                self.client.databases.query,
                 database_id=self.database_id,
-                filter={
-                    "property": "Episode Live",
-                    "checkbox": {
-                        "equals": True
-                    }
-                }
+                filter=_LIVE_FILTER
             )
             
-            episodes = []
-            for page in response.get("results", []):
+            for page in pages:
                 episode = self._parse_episode(page)
                 if episode:
-                    episodes.append(episode)
-            
-            print(f"✅ Found {len(episodes)} live episodes")
-            return episodes
+                    found += 1
+                    yield episode
             
         except Exception as e:
-            print(f"❌ Error querying Notion database: {e}")
+            _log(f"❌ Error querying Notion database: {e}")
             raise
+        
+        _log(f"✅ Found {found} live episodes")
 
     def _parse_episode(self, page: Dict) -> Optional[Dict]:
         """
@@ -159,38 +241,110 @@ class NotionEpisodeSync:
             print(f"⚠️  Error parsing episode: {e}")
             return None
 
-    def _get_episode_filename(self, episode: Dict) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _get_episode_filename(title: str, episode_number: Optional[int]) -> str:
         """
         Generate consistent filename for episode.
 
         Args:
-            episode: Episode metadata dictionary
+            title: Episode title
+            episode_number: Episode number, if known
 
         Returns:
             Filename for the episode
         """
-        slug = slugify(episode["title"])
+        slug = fast_slug(title)
         
-        if episode["episode_number"]:
-            return f"episode-{episode['episode_number']:03d}-{slug}"
+        if episode_number:
+            return f"episode-{episode_number:03d}-{slug}"
         else:
             # Use hash of title if no episode number
-            title_hash = hashlib.md5(episode["title"].encode()).hexdigest()[:8]
+            title_hash = hashlib.md5(title.encode()).hexdigest()[:8]
             return f"episode-{title_hash}-{slug}"
 
     def _file_exists(self, filename_base: str) -> bool:
         """
         Check if episode file already exists.
 
+        Uses the directory listing taken at the start of sync() when
+        available, instead of a stat() per episode.
+
         Args:
             filename_base: Base filename without extension
 
         Returns:
             True if file exists, False otherwise
         """
+        if self._existing is not None:
+            return filename_base in self._existing
+        
         mp3_file = self.episodes_dir / f"{filename_base}.mp3"
         return mp3_file.exists()
 
+    def _read_metadata(self, metadata_file: Path) -> Dict:
+        """
+        Load an episode's metadata sidecar.
+
+        Args:
+            metadata_file: Path to the -metadata.json file
+
+        Returns:
+            Metadata dictionary, or an empty dict if missing or unreadable
+        """
+        try:
+            data = metadata_file.read_bytes()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return {}
+
+    def _head(self, url: str) -> Optional[requests.Response]:
+        """
+        Fetch an episode file's headers without its body.
+
+        Args:
+            url: Episode file URL
+
+        Returns:
+            HEAD response, or None if the request failed
+        """
+        try:
+            head = self.session.head(url, timeout=30, allow_redirects=True)
+            head.raise_for_status()
+            return head
+        except requests.RequestException as e:
+            _log(f"⚠️  Could not check remote file: {e}")
+            return None
+
+    def _remote_changed(self, head: Optional[requests.Response], metadata: Dict) -> bool:
+        """
+        Check whether a downloaded file changed upstream.
+
+        Compares ETag, then Last-Modified, then Content-Length against the
+        values stored at download time. If nothing can be compared, or the
+        HEAD request failed, the local copy is kept.
+
+        Args:
+            head: HEAD response for the episode file, if any
+            metadata: Stored metadata for the local copy
+
+        Returns:
+            True if the remote file differs from the local copy
+        """
+        if head is None or not metadata:
+            return False
+        
+        etag = head.headers.get("ETag")
+        if etag and metadata.get("etag"):
+            return etag != metadata["etag"]
+        last_modified = head.headers.get("Last-Modified")
+        if last_modified and metadata.get("last_modified"):
+            return last_modified != metadata["last_modified"]
+        content_length = head.headers.get("Content-Length")
+        if content_length and metadata.get("file_size") is not None:
+            return int(content_length) != metadata["file_size"]
+        return False
+
     def download_episode(self, episode: Dict) -> bool:
         """
         Download episode MP3 file from URL.
@@ -201,32 +355,81 @@ class NotionEpisodeSync:
         Returns:
             True if download successful, False otherwise
         """
-        filename_base = self._get_episode_filename(episode)
+        filename_base = self._get_episode_filename(episode["title"], episode["episode_number"])
+        mp3_file = self.episodes_dir / f"{filename_base}.mp3"
+        partial_file = self.episodes_dir / f"{filename_base}.mp3.part"
+        metadata_file = self.episodes_dir / f"{filename_base}-metadata.json"
         
-        # Check if already downloaded
-        if self._file_exists(filename_base):
-            print(f"⏭️  Episode already exists: {filename_base}")
+        # Check if already downloaded, and still current upstream. Without
+        # stored metadata there is nothing to compare, so skip the HEAD
+        exists = self._file_exists(filename_base)
+        metadata = self._read_metadata(metadata_file) if exists else {}
+        if exists and not metadata:
+            _log(f"⏭️  Episode already exists: {filename_base}")
             return False
         
-        mp3_file = self.episodes_dir / f"{filename_base}.mp3"
-        metadata_file = self.episodes_dir / f"{filename_base}-metadata.json"
+        head = self._head(episode["file_url"])
+        
+        request_headers = {}
+        if exists:
+            if not self._remote_changed(head, metadata):
+                _log(f"⏭️  Episode already exists: {filename_base}")
+                return False
+            _log(f"🔄 Remote file changed: {filename_base}")
+            # Let the server answer 304 if it still considers our copy current
+            if metadata.get("etag"):
+                request_headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                request_headers["If-Modified-Since"] = metadata["last_modified"]
         
-        print(f"⬇️  Downloading: {episode['title']}")
+        # Reject non-audio URLs (e.g. an HTML error page) before fetching the body
+        expected_size = 0
+        if head is not None:
+            content_type = head.headers.get("content-type", "")
+            if content_type and "audio" not in content_type and "octet-stream" not in content_type:
+                _log(f"❌ Not an audio file ({content_type}): {episode['file_url']}")
+                return False
+            expected_size = int(head.headers.get("content-length") or 0)
+        
+        _log(f"⬇️  Downloading: {episode['title']}")
         
         # Download with retries
         for attempt in range(MAX_RETRIES):
             try:
-                response = requests.get(episode["file_url"], timeout=300)
-                response.raise_for_status()
-                
-                # Validate content type
-                content_type = response.headers.get("content-type", "")
-                if "audio" not in content_type and "octet-stream" not in content_type:
-                    print(f"⚠️  Warning: Unexpected content type: {content_type}")
+                with self.session.get(
+                    episode["file_url"], headers=request_headers, timeout=300, stream=True
+                ) as response:
+                    if response.status_code == 304:
+                        _log(f"⏭️  Episode already current: {filename_base}")
+                        return False
+                    response.raise_for_status()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    
+                    # Validate content type
+                    content_type = response.headers.get("content-type", "")
+                    if "audio" not in content_type and "octet-stream" not in content_type:
+                        _log(f"⚠️  Warning: Unexpected content type: {content_type}")
+                    
+                    # Stream to a partial file so memory stays bounded and an
+                    # interrupted download is never mistaken for a finished one
+                    file_size = 0
+                    with open(partial_file, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                        if expected_size and hasattr(os, "posix_fallocate"):
+                            try:
+                                os.posix_fallocate(f.fileno(), 0, expected_size)
+                            except OSError:
+                                pass  # Not supported by this filesystem
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            file_size += len(chunk)
+                        # Drop any preallocated space the body did not fill
+                        f.truncate()
                 
-                # Save MP3 file
-                mp3_file.write_bytes(response.content)
-                print(f"✅ Downloaded: {mp3_file.name} ({len(response.content)} bytes)")
+                partial_file.replace(mp3_file)
+                if self._existing is not None:
+                    self._existing.add(filename_base)
+                _log(f"✅ Downloaded: {mp3_file.name} ({file_size} bytes)")
                 
                 # Save metadata
                 metadata = {
@@ -237,18 +440,24 @@ class NotionEpisodeSync:
                     "notion_id": episode["notion_id"],
                     "file_url": episode["file_url"],
                     "downloaded_at": datetime.utcnow().isoformat(),
-                    "file_size": len(response.content),
+                    "file_size": file_size,
+                    "etag": etag,
+                    "last_modified": last_modified,
                 }
-                metadata_file.write_text(json.dumps(metadata, indent=2))
+                if orjson is not None:
+                    metadata_file.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+                else:
+                    metadata_file.write_text(json.dumps(metadata, indent=2))
                 
                 return True
                 
             except requests.RequestException as e:
-                print(f"⚠️  Attempt {attempt + 1}/{MAX_RETRIES} failed: {e}")
+                partial_file.unlink(missing_ok=True)
+                _log(f"⚠️  Attempt {attempt + 1}/{MAX_RETRIES} failed: {e}")
                 if attempt < MAX_RETRIES - 1:
                     time.sleep(RETRY_DELAY)
                 else:
-                    print(f"❌ Failed to download after {MAX_RETRIES} attempts")
+                    _log(f"❌ Failed to download after {MAX_RETRIES} attempts")
                     return False
         
         return False
@@ -262,12 +471,26 @@ class NotionEpisodeSync:
         """
         print("🚀 Starting Notion episode sync...")
         
-        episodes = self.get_live_episodes()
-        downloaded_count = 0
+        # List downloaded episodes once instead of checking each file
+        self._existing = {path.stem for path in self.episodes_dir.glob("*.mp3")}
         
-        for episode in episodes:
-            if self.download_episode(episode):
-                downloaded_count += 1
+        # Downloads are network-bound, so run them on a thread pool, starting
+        # each one as soon as its page of query results has been parsed
+        try:
+            with ThreadPoolExecutor(max_workers=SYNC_CONCURRENCY) as executor:
+                futures = []
+                submitted = set()
+                for episode in self.iter_live_episodes():
+                    # Episodes that map to the same file are downloaded once
+                    filename_base = self._get_episode_filename(episode["title"], episode["episode_number"])
+                    if filename_base in submitted:
+                        _log(f"⏭️  Episode already exists: {filename_base}")
+                        continue
+                    submitted.add(filename_base)
+                    futures.append(executor.submit(self.download_episode, episode))
+                downloaded_count = sum(1 for future in as_completed(futures) if future.result())
+        finally:
+            self.session.close()
         
         print(f"\n📊 Sync complete: {downloaded_count} new episodes downloaded")
         return downloaded_count
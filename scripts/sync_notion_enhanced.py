@@ -12,11 +12,18 @@ This module extends the original sync_notion.py with:
 
 import os
 import json
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 
-from notion_client import Client
+from notion_client.helpers import iterate_paginated_api
+
+from sync_utils import NOTION_MAX_RETRIES, retry_delay
+from notion_utils import NotionClient
 
 # Import utilities
 try:
@@ -32,6 +39,79 @@ except ImportError:
     print("⚠️  Google Drive utilities not available (import failed)")
 
 
+# Upper bound on season databases processed in parallel
+MAX_PARALLEL_SEASONS = 8
+
+# Concurrent pages.update calls per database (Notion allows ~3 requests/second)
+UPDATE_WORKERS = 3
+
+# Caps in-flight pages.update calls across all season threads at the same
+# bound, since Notion rate-limits per integration rather than per database
+_update_slots = threading.BoundedSemaphore(UPDATE_WORKERS)
+
+# Retrofit steps an episode still needs, as bit flags
+NEED_PROMPT = 1  # Prompt-Input set but no Script-Doc-Link yet
+NEED_NOTEBOOKLM = 2  # Script-Doc-Link set but no Track-Cloud yet
+NEED_DURATION = 4  # Track-Cloud set but no Duration yet
+NEED_SHOW_NOTES = 8  # Track-Cloud set but no Show-Notes-Link yet
+
+
+def retrofit_mask(episode: Dict) -> int:
+    """
+    Work out which retrofit steps an episode still needs.
+    
+    Args:
+        episode: Episode metadata dictionary
+        
+    Returns:
+        Bitwise OR of the NEED_* flags
+    """
+    script_doc_link = episode.get("script_doc_link")
+    track_cloud = episode.get("track_cloud")
+    
+    mask = 0
+    if episode.get("prompt_input") and not script_doc_link:
+        mask |= NEED_PROMPT
+    if script_doc_link and not track_cloud:
+        mask |= NEED_NOTEBOOKLM
+    if track_cloud and not episode.get("duration"):
+        mask |= NEED_DURATION
+    if track_cloud and not episode.get("show_notes_link"):
+        mask |= NEED_SHOW_NOTES
+    return mask
+
+
+@functools.cache
+def _status_filter(status: str) -> Dict:
+    """Build (once per status) the query filter matching a Status value."""
+    return {
+        "property": "Status",
+        "select": {
+            "equals": status
+        }
+    }
+
+
+# Serializes output from parallel season threads, each of which tags its
+# lines with the season it is processing
+_print_lock = threading.Lock()
+_log_context = threading.local()
+
+
+def _set_log_prefix(prefix: str) -> None:
+    """Tag every line this thread logs with a prefix (e.g. '[S3] ')."""
+    _log_context.prefix = prefix
+
+
+def _log(message: str) -> None:
+    """Print a message, prefixed per thread, without interleaving other threads."""
+    prefix = getattr(_log_context, "prefix", "")
+    if prefix:
+        message = "\n".join(prefix + line if line else line for line in message.split("\n"))
+    with _print_lock:
+        print(message)
+
+
 class EnhancedNotionSync:
     """Enhanced Notion synchronization with bidirectional support."""
     
@@ -49,11 +129,14 @@ class EnhancedNotionSync:
             database_id: ID of the Notion database
             enable_google_drive: Whether to enable Google Drive features
         """
-        self.client = Client(auth=token)
+        self.client = NotionClient(auth=token)
         self.database_id = database_id
         self.episodes_dir = Path("episodes")
         self.prompts_dir = self.episodes_dir / "prompts"
         
+        # Property changes queued by retrofit_episode(defer_flush=True)
+        self._pending_updates: List[Tuple[str, Dict]] = []
+        
         # Initialize Google Drive client if available
         self.google_drive = None
         self.notebook_lm = None
@@ -62,9 +145,9 @@ class EnhancedNotionSync:
             try:
                 self.google_drive = GoogleDriveClient()
                 self.notebook_lm = NotebookLMClient()
-                print("✅ Google Drive integration enabled")
+                _log("✅ Google Drive integration enabled")
             except Exception as e:
-                print(f"⚠️  Google Drive initialization failed: {e}")
+                _log(f"⚠️  Google Drive initialization failed: {e}")
     
     def get_episodes_with_status(self, status: str = "Not started") -> List[Dict]:
         """
@@ -76,30 +159,27 @@ class EnhancedNotionSync:
         Returns:
             List of episode dictionaries
         """
-        print(f"🔍 Querying episodes with status: {status}")
+        _log(f"🔍 Querying episodes with status: {status}")
         
         try:
-            response = self.client.databases.query(
+            # Follow next_cursor so databases with more than 100 episodes are complete
+            pages = iterate_paginated_api(
+                self.client.databases.query,
                 database_id=self.database_id,
-                filter={
-                    "property": "Status",
-                    "select": {
-                        "equals": status
-                    }
-                }
+                filter=_status_filter(status)
             )
             
             episodes = []
-            for page in response.get("results", []):
+            for page in pages:
                 episode = self._parse_episode_extended(page)
                 if episode:
                     episodes.append(episode)
             
-            print(f"✅ Found {len(episodes)} episodes with status '{status}'")
+            _log(f"✅ Found {len(episodes)} episodes with status '{status}'")
             return episodes
             
         except Exception as e:
-            print(f"❌ Error querying Notion database: {e}")
+            _log(f"❌ Error querying Notion database: {e}")
             return []
     
     def _parse_episode_extended(self, page: Dict) -> Optional[Dict]:
@@ -129,7 +209,7 @@ class EnhancedNotionSync:
             duration = self._get_text_property(properties.get("Duration", {}))
             show_notes_link = self._get_url_property(properties.get("Show-Notes-Link", {}))
             
-            return {
+            parsed = {
                 "notion_id": page["id"],
                 "title": title,
                 "season": season,
@@ -142,9 +222,11 @@ class EnhancedNotionSync:
                 "duration": duration,
                 "show_notes_link": show_notes_link
             }
+            parsed["retrofit_mask"] = retrofit_mask(parsed)
+            return parsed
             
         except Exception as e:
-            print(f"⚠️  Error parsing episode: {e}")
+            _log(f"⚠️  Error parsing episode: {e}")
             return None
     
     def _get_title_property(self, prop: Dict) -> str:
@@ -174,64 +256,114 @@ class EnhancedNotionSync:
         """Extract URL from property."""
         return prop.get("url", "")
     
-    def update_notion_property(
+    def stage_property(
         self,
-        page_id: str,
+        updates: Dict,
         property_name: str,
         value: any,
         property_type: str = "rich_text"
     ) -> bool:
         """
-        Update a Notion page property.
+        Stage a Notion page property change for the next flush_updates call.
         
         Args:
-            page_id: Notion page ID
+            updates: Pending property changes for one page
             property_name: Name of property to update
             value: New value
             property_type: Type of property (rich_text, url, number, etc.)
             
         Returns:
-            True if successful
+            True if the property was staged
         """
-        try:
-            if property_type == "rich_text":
-                properties = {
-                    property_name: {
-                        "rich_text": [{"text": {"content": str(value)}}]
-                    }
-                }
-            elif property_type == "url":
-                properties = {
-                    property_name: {"url": str(value)}
-                }
-            elif property_type == "number":
-                properties = {
-                    property_name: {"number": value}
-                }
-            else:
-                print(f"⚠️  Unsupported property type: {property_type}")
-                return False
+        if property_type == "rich_text":
+            updates[property_name] = {
+                "rich_text": [{"text": {"content": str(value)}}]
+            }
+        elif property_type == "url":
+            updates[property_name] = {"url": str(value)}
+        elif property_type == "number":
+            updates[property_name] = {"number": value}
+        else:
+            _log(f"⚠️  Unsupported property type: {property_type}")
+            return False
+        
+        return True
+    
+    def flush_updates(self, page_id: str, updates: Dict) -> bool:
+        """
+        Write all staged property changes to a Notion page in one request.
+        
+        Rate limits and server errors are retried with backoff; the update
+        is idempotent, so a retry after a lost response is safe.
+        
+        Args:
+            page_id: Notion page ID
+            updates: Pending property changes
             
-            self.client.pages.update(page_id=page_id, properties=properties)
-            print(f"✅ Updated {property_name} for page {page_id[:8]}...")
+        Returns:
+            True if successful (or there was nothing to write)
+        """
+        if not updates:
             return True
-            
-        except Exception as e:
-            print(f"❌ Failed to update Notion property: {e}")
-            return False
+        
+        for attempt in range(NOTION_MAX_RETRIES + 1):
+            try:
+                with _update_slots:
+                    self.client.pages.update(page_id=page_id, properties=updates)
+                _log(f"✅ Updated {', '.join(updates)} for page {page_id[:8]}...")
+                return True
+                
+            except Exception as e:
+                delay = retry_delay(e, attempt)
+                if delay is None or attempt == NOTION_MAX_RETRIES:
+                    _log(f"❌ Failed to update Notion properties: {e}")
+                    return False
+                _log(f"⚠️  Notion API error ({e}), retrying in {delay:.0f}s...")
+                time.sleep(delay)
+        return False
+    
+    def _queue_updates(self, page_id: str, updates: Dict):
+        """Queue staged property changes for flush_pending_updates()."""
+        if updates:
+            self._pending_updates.append((page_id, updates))
     
-    def process_prompt_input(self, episode: Dict) -> bool:
+    def flush_pending_updates(self) -> int:
+        """
+        Write all queued property changes, several pages at a time.
+        
+        The updates share the client's pooled connection, so a season's
+        worth of retrofits costs one handshake rather than one per page.
+        
+        Returns:
+            Number of pages that failed to update
+        """
+        pending, self._pending_updates = self._pending_updates, []
+        if not pending:
+            return 0
+        
+        _log(f"📤 Writing updates for {len(pending)} pages...")
+        # Workers log under the same season tag as the calling thread
+        with ThreadPoolExecutor(
+            max_workers=UPDATE_WORKERS,
+            initializer=_set_log_prefix,
+            initargs=(getattr(_log_context, "prefix", ""),)
+        ) as executor:
+            results = executor.map(lambda item: self.flush_updates(*item), pending)
+            return sum(1 for ok in results if not ok)
+    
+    def process_prompt_input(self, episode: Dict, updates: Dict) -> bool:
         """
         Process Prompt-Input field and create Google Doc.
         
         Args:
             episode: Episode metadata dictionary
+            updates: Pending Notion property changes for the episode
             
         Returns:
             True if successful
         """
         if not self.google_drive:
-            print("⚠️  Google Drive not available, skipping prompt processing")
+            _log("⚠️  Google Drive not available, skipping prompt processing")
             return False
         
         prompt_text = episode.get("prompt_input", "")
@@ -240,9 +372,9 @@ class EnhancedNotionSync:
             prompt_file = self.prompts_dir / f"prompt_S{episode['season']:02d}E{episode['episode']:03d}.txt"
             if prompt_file.exists():
                 prompt_text = prompt_file.read_text()
-                print(f"📄 Loaded prompt from: {prompt_file.name}")
+                _log(f"📄 Loaded prompt from: {prompt_file.name}")
             else:
-                print("⚠️  No prompt input found")
+                _log("⚠️  No prompt input found")
                 return False
         
         # Create Google Doc with prompt content
@@ -252,22 +384,18 @@ class EnhancedNotionSync:
             content=prompt_text
         )
         
-        # Update Notion with Script-Doc-Link
-        self.update_notion_property(
-            episode["notion_id"],
-            "Script-Doc-Link",
-            doc_result["url"],
-            "url"
-        )
+        # Stage Script-Doc-Link for the episode's Notion update
+        self.stage_property(updates, "Script-Doc-Link", doc_result["url"], "url")
         
         return True
     
-    def process_notebooklm_integration(self, episode: Dict) -> bool:
+    def process_notebooklm_integration(self, episode: Dict, updates: Dict) -> bool:
         """
         Process NotebookLM integration for episode.
         
         Args:
             episode: Episode metadata dictionary
+            updates: Pending Notion property changes for the episode
             
         Returns:
             True if successful
@@ -288,22 +416,18 @@ class EnhancedNotionSync:
         # Generate audio overview
         audio_result = self.notebook_lm.generate_audio_overview(notebook_id)
         
-        # Update Notion with Track-Cloud
-        self.update_notion_property(
-            episode["notion_id"],
-            "Track-Cloud",
-            audio_result["url"],
-            "url"
-        )
+        # Stage Track-Cloud for the episode's Notion update
+        self.stage_property(updates, "Track-Cloud", audio_result["url"], "url")
         
         return True
     
-    def process_audio_metadata(self, episode: Dict) -> bool:
+    def process_audio_metadata(self, episode: Dict, updates: Dict) -> bool:
         """
         Extract audio duration and update Notion.
         
         Args:
             episode: Episode metadata dictionary
+            updates: Pending Notion property changes for the episode
             
         Returns:
             True if successful
@@ -316,22 +440,18 @@ class EnhancedNotionSync:
         # For now, use placeholder
         duration = "45:30"
         
-        # Update Notion with duration
-        self.update_notion_property(
-            episode["notion_id"],
-            "Duration",
-            duration,
-            "rich_text"
-        )
+        # Stage duration for the episode's Notion update
+        self.stage_property(updates, "Duration", duration, "rich_text")
         
         return True
     
-    def generate_and_upload_show_notes(self, episode: Dict) -> bool:
+    def generate_and_upload_show_notes(self, episode: Dict, updates: Dict) -> bool:
         """
         Generate show notes and upload as Google Doc.
         
         Args:
             episode: Episode metadata dictionary
+            updates: Pending Notion property changes for the episode
             
         Returns:
             True if successful
@@ -349,57 +469,79 @@ class EnhancedNotionSync:
             content=show_notes
         )
         
-        # Update Notion with Show-Notes-Link
-        self.update_notion_property(
-            episode["notion_id"],
-            "Show-Notes-Link",
-            doc_result["url"],
-            "url"
-        )
+        # Stage Show-Notes-Link for the episode's Notion update
+        self.stage_property(updates, "Show-Notes-Link", doc_result["url"], "url")
         
         return True
     
-    def retrofit_episode(self, episode: Dict) -> bool:
+    def retrofit_episode(self, episode: Dict, defer_flush: bool = False) -> bool:
         """
         Run complete retrofit automation for an episode.
         
         Args:
             episode: Episode metadata dictionary
+            defer_flush: Queue the Notion update for flush_pending_updates()
+                instead of writing it immediately
             
         Returns:
             True if successful
         """
-        print(f"\n🔧 Retrofitting episode: {episode.get('title', 'Unknown')}")
+        # Steps to run, computed once when the episode was parsed
+        mask = episode.get("retrofit_mask")
+        if mask is None:
+            mask = retrofit_mask(episode)
+        
+        if not mask:
+            _log(f"⏭️  Nothing to retrofit: {episode.get('title', 'Unknown')}")
+            return True
+        
+        _log(f"\n🔧 Retrofitting episode: {episode.get('title', 'Unknown')}")
+        
+        # Property changes from all steps are written in one pages.update call
+        updates = {}
         
         try:
             # Step 1: Process prompt input
-            if episode.get("prompt_input") and not episode.get("script_doc_link"):
-                self.process_prompt_input(episode)
+            if mask & NEED_PROMPT:
+                self.process_prompt_input(episode, updates)
             
             # Step 2: Process NotebookLM integration
-            if episode.get("script_doc_link") and not episode.get("track_cloud"):
-                self.process_notebooklm_integration(episode)
+            if mask & NEED_NOTEBOOKLM:
+                self.process_notebooklm_integration(episode, updates)
             
             # Step 3: Extract audio metadata
-            if episode.get("track_cloud") and not episode.get("duration"):
-                self.process_audio_metadata(episode)
+            if mask & NEED_DURATION:
+                self.process_audio_metadata(episode, updates)
             
             # Step 4: Generate show notes
-            if episode.get("track_cloud") and not episode.get("show_notes_link"):
-                self.generate_and_upload_show_notes(episode)
-            
-            print(f"✅ Retrofit complete for episode")
-            return True
+            if mask & NEED_SHOW_NOTES:
+                self.generate_and_upload_show_notes(episode, updates)
             
         except Exception as e:
-            print(f"❌ Retrofit failed: {e}")
+            _log(f"❌ Retrofit failed: {e}")
+            # Keep the results of the steps that did complete
+            if defer_flush:
+                self._queue_updates(episode["notion_id"], updates)
+            else:
+                self.flush_updates(episode["notion_id"], updates)
+            return False
+        
+        if defer_flush:
+            self._queue_updates(episode["notion_id"], updates)
+        elif not self.flush_updates(episode["notion_id"], updates):
             return False
+        
+        _log(f"✅ Retrofit complete for episode")
+        return True
 
 
+@functools.cache
 def get_season_database_ids() -> List[Tuple[int, str]]:
     """
     Get all season-specific database IDs from environment variables.
     
+    The environment is read once per process; later calls reuse the result.
+    
     Returns:
         List of tuples containing (season_number, database_id) for all configured seasons
     """
@@ -410,11 +552,53 @@ def get_season_database_ids() -> List[Tuple[int, str]]:
         db_id = os.environ.get(f"PR_CYBR_P0D_S{season}_DB_ID")
         if db_id:
             database_ids.append((season, db_id))
-            print(f"✅ Found database ID for Season {season}")
+            _log(f"✅ Found database ID for Season {season}")
     
     return database_ids
 
 
+def process_database(notion_token: str, season: int, db_id: str) -> Tuple[int, int]:
+    """
+    Retrofit all not-started episodes in one season database.
+    
+    Each call builds its own EnhancedNotionSync (and Notion client), so
+    databases can be processed from separate threads.
+    
+    Args:
+        notion_token: Notion API integration token
+        season: Season number (0 for the fallback database)
+        db_id: Notion database ID
+        
+    Returns:
+        Tuple of (episodes found to process, pages whose update failed)
+    """
+    _set_log_prefix(f"[S{season}] " if season > 0 else f"[{db_id[:8]}] ")
+    
+    _log(f"\n{'=' * 70}")
+    if season > 0:
+        _log(f"Processing Season {season} database: {db_id[:8]}...")
+    else:
+        _log(f"Processing database: {db_id[:8]}...")
+    _log(f"{'=' * 70}")
+    
+    # Initialize sync for this database
+    sync = EnhancedNotionSync(notion_token, db_id)
+    
+    # Find episodes to retrofit
+    episodes = sync.get_episodes_with_status("Not started")
+    
+    _log(f"\n📊 Found {len(episodes)} episodes to process")
+    
+    # Process each episode, then write all Notion updates together
+    for episode in episodes:
+        sync.retrofit_episode(episode, defer_flush=True)
+    failed_updates = sync.flush_pending_updates()
+    if failed_updates:
+        _log(f"⚠️  {failed_updates} Notion page updates failed")
+    
+    return len(episodes), failed_updates
+
+
 def main():
     """Main entry point for enhanced sync."""
     print("=" * 70)
@@ -443,31 +627,24 @@ def main():
     
     print(f"\n📊 Found {len(season_databases)} database(s) to process")
     
-    # Process each database
-    total_episodes = 0
-    for season, db_id in season_databases:
-        print(f"\n{'=' * 70}")
-        if season > 0:
-            print(f"Processing Season {season} database: {db_id[:8]}...")
-        else:
-            print(f"Processing database: {db_id[:8]}...")
-        print(f"{'=' * 70}")
-        
-        # Initialize sync for this database
-        sync = EnhancedNotionSync(notion_token, db_id)
-        
-        # Find episodes to retrofit
-        episodes = sync.get_episodes_with_status("Not started")
-        total_episodes += len(episodes)
-        
-        print(f"\n📊 Found {len(episodes)} episodes to process")
-        
-        # Process each episode
-        for episode in episodes:
-            sync.retrofit_episode(episode)
+    # Seasons are independent and network-bound, so process them in parallel
+    max_workers = min(len(season_databases), MAX_PARALLEL_SEASONS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(process_database, notion_token, season, db_id)
+            for season, db_id in season_databases
+        ]
+        total_episodes = 0
+        total_failed = 0
+        for future in as_completed(futures):
+            episodes, failed_updates = future.result()
+            total_episodes += episodes
+            total_failed += failed_updates
     
     print("\n" + "=" * 70)
     print(f"✅ Enhanced sync complete - Processed {total_episodes} total episodes")
+    if total_failed:
+        print(f"⚠️  {total_failed} Notion page updates failed")
     print("=" * 70)
 
 
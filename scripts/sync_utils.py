@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Shared Sync Utilities
+
+Small standard-library helpers shared by the sync scripts:
+- Positive integer settings read from the environment
+- Retry policy for Notion API calls
+"""
+
+import os
+from typing import Optional
+
+
+# Retry settings for rate-limited (429) and transient server errors
+NOTION_MAX_RETRIES = 5
+NOTION_RETRY_BACKOFF = 1  # seconds, doubled on each attempt
+NOTION_MAX_RETRY_DELAY = 60  # seconds
+NOTION_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+def env_int(name: str, default: int) -> int:
+    """
+    Read a positive integer setting from the environment.
+    
+    A malformed value falls back to the default instead of breaking import.
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+        
+    Returns:
+        The configured value (at least 1)
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        print(f"⚠️  Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
+def retry_delay(error: Exception, attempt: int, idempotent: bool = True) -> Optional[float]:
+    """
+    Work out how long to wait before retrying a failed Notion API call.
+    
+    Honors the server's Retry-After header when rate limited, otherwise
+    backs off exponentially.
+    
+    Args:
+        error: Exception raised by the Notion client
+        attempt: Zero-based attempt number that failed
+        idempotent: Whether the call is safe to repeat. Non-idempotent calls
+            are only retried when rate limited, since a server error may
+            arrive after the request already took effect.
+        
+    Returns:
+        Delay in seconds, or None if the error should not be retried
+    """
+    # notion_client's APIResponseError exposes code, status and headers
+    status = getattr(error, "status", None)
+    rate_limited = getattr(error, "code", None) == "rate_limited" or status == 429
+    if not rate_limited and (not idempotent or status not in NOTION_RETRYABLE_STATUSES):
+        return None
+    
+    headers = getattr(error, "headers", None) or {}
+    try:
+        return min(float(headers.get("Retry-After")), NOTION_MAX_RETRY_DELAY)
+    except (TypeError, ValueError):
+        return min(NOTION_RETRY_BACKOFF * (2 ** attempt), NOTION_MAX_RETRY_DELAY)